@@ -25,6 +25,8 @@ with DAG(
     default_args=default_args,
     tags=['ETL', 'dbt', 'data_warehouse'],
     catchup=False,
+    # Scales every generated table proportionally (1 = 20,000 customers, 5,000 orders)
+    params={"scale_factor": 1},
 ) as dag:
     pipeline_bucket = "data-pipeline-storage"
 
@@ -53,7 +55,7 @@ with DAG(
 
     upload_synthetic_files = BashOperator(
         task_id="upload_synthetic_files",
-        bash_command="cd /opt/airflow/dags/functions/ && python -u data_created.py"
+        bash_command="cd /opt/airflow/dags/functions/ && python -u data_created.py --scale-factor {{ params.scale_factor }}"
     )
 
     bronze_init = EmptyOperator(
@@ -1,39 +1,505 @@
+import ast
+import binascii
+import time
 import numpy as np
 import pandas as pd
-import random
+import pyarrow as pa
+from concurrent.futures import ProcessPoolExecutor
 from faker import Faker
-from typing import List, Dict, Union, Optional
-from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Iterator, List, Dict, Tuple, Union, Optional
+from datetime import datetime
+
+
+# Per-process generator used by ProcessPoolExecutor workers, rebuilt only
+# when the worker receives a task from a differently configured generator
+_worker_generator = None
+
+
+def _generate_rows_worker(generator_kwargs: Dict, dataset_id: int, plan: "DatasetPlan",
+                          start: int, stop: int, include_index, output: str = "pandas"):
+    """Generate rows ``start:stop`` of a dataset inside a worker process"""
+    global _worker_generator
+    if _worker_generator is None or _worker_generator._init_kwargs != generator_kwargs:
+        _worker_generator = RandomDatasetGenerator(**generator_kwargs)
+    return _worker_generator._generate_chunk(
+        stop - start, start, plan, dataset_id, include_index, output)
+
+
+# Functions a "custom" dependent-column expression may call; all of them
+# work elementwise on whole columns
+_EXPRESSION_FUNCTIONS = {
+    "abs": np.abs, "round": np.round, "floor": np.floor, "ceil": np.ceil,
+    "sqrt": np.sqrt, "log": np.log, "log10": np.log10, "exp": np.exp,
+    "sin": np.sin, "cos": np.cos, "minimum": np.minimum, "maximum": np.maximum,
+    "clip": np.clip, "where": np.where, "isin": np.isin,
+    "int": lambda x: np.asarray(x).astype(np.int64),
+    "float": lambda x: np.asarray(x).astype(np.float64),
+    "str": lambda x: np.asarray(x).astype(str).astype(object),
+    # Targets of the and/or/not/if-else rewrites below
+    "_and": lambda *xs: np.logical_and.reduce(xs),
+    "_or": lambda *xs: np.logical_or.reduce(xs),
+    "_not": np.logical_not,
+}
+
+_EXPRESSION_NODES = (
+    ast.Expression, ast.Lambda, ast.arguments, ast.arg, ast.Load,
+    ast.BinOp, ast.UnaryOp, ast.BoolOp, ast.Compare, ast.IfExp, ast.Call,
+    ast.Name, ast.Constant, ast.Tuple, ast.List,
+    ast.Add, ast.Sub, ast.Mult, ast.Div, ast.FloorDiv, ast.Mod, ast.Pow,
+    ast.USub, ast.UAdd, ast.Not, ast.And, ast.Or,
+    ast.Eq, ast.NotEq, ast.Lt, ast.LtE, ast.Gt, ast.GtE,
+)
+
+
+class _VectorizeExpression(ast.NodeTransformer):
+    """Rewrite Python's scalar-only constructs into their elementwise forms"""
+
+    def _call(self, name, args, node):
+        return ast.copy_location(ast.Call(
+            func=ast.Name(id=name, ctx=ast.Load()), args=args, keywords=[]), node)
+
+    def visit_BoolOp(self, node):
+        self.generic_visit(node)
+        return self._call("_and" if isinstance(node.op, ast.And) else "_or", node.values, node)
+
+    def visit_UnaryOp(self, node):
+        self.generic_visit(node)
+        if isinstance(node.op, ast.Not):
+            return self._call("_not", [node.operand], node)
+        return node
+
+    def visit_IfExp(self, node):
+        self.generic_visit(node)
+        return self._call("where", [node.test, node.body, node.orelse], node)
+
+    def visit_Compare(self, node):
+        self.generic_visit(node)
+        if len(node.ops) == 1:
+            return node
+        # a < x < b -> (a < x) & (x < b)
+        operands = [node.left] + node.comparators
+        pairs = [ast.Compare(left=left, ops=[op], comparators=[right])
+                 for left, op, right in zip(operands, node.ops, operands[1:])]
+        return self._call("_and", pairs, node)
+
+
+@lru_cache(maxsize=256)
+def _compile_expression(expression: str, n_args: int):
+    """
+    Compile a ``"x: <expr>"`` (or ``"x, y: <expr>"``) dependent-column
+    expression once into a function over whole columns. Only arithmetic,
+    comparisons, and/or/not, if-else and _EXPRESSION_FUNCTIONS are allowed.
+    """
+    try:
+        tree = ast.parse(f"lambda {expression}", mode="eval")
+    except SyntaxError as e:
+        raise ValueError(f"Invalid custom expression {expression!r}: {e}") from e
+
+    lambda_node = tree.body
+    arg_names = [arg.arg for arg in lambda_node.args.args]
+    if len(arg_names) != n_args:
+        raise ValueError(
+            f"Custom expression {expression!r} takes {len(arg_names)} arguments "
+            f"but depends on {n_args} columns")
+
+    for node in ast.walk(tree):
+        if not isinstance(node, _EXPRESSION_NODES):
+            raise ValueError(
+                f"Unsupported syntax in custom expression {expression!r}: {type(node).__name__}")
+        if isinstance(node, ast.Call) and (
+                not isinstance(node.func, ast.Name) or node.func.id not in _EXPRESSION_FUNCTIONS):
+            raise ValueError(f"Unsupported function in custom expression {expression!r}")
+        if isinstance(node, ast.Call) and node.keywords:
+            raise ValueError(f"Keyword arguments are not supported in {expression!r}")
+        if isinstance(node, ast.Name) and node.id not in arg_names and node.id not in _EXPRESSION_FUNCTIONS:
+            raise ValueError(f"Unknown name {node.id!r} in custom expression {expression!r}")
+
+    tree = ast.fix_missing_locations(_VectorizeExpression().visit(tree))
+    namespace = {"__builtins__": {}, **_EXPRESSION_FUNCTIONS}
+    return eval(compile(tree, "<custom expression>", "eval"), namespace)
+
+
+class ChoiceSampler:
+    """
+    Draws from a fixed choice set in O(1) per draw.
+
+    The set is converted to an array once. Uniform draws pick a random
+    position; weighted draws use Walker alias tables (a cached CDF with
+    binary search past ``ALIAS_MAX`` entries, where building the tables
+    would cost more than it saves); ``zipf=s`` gives Zipf-skewed popularity
+    with exponent ``s`` without materializing any weights. Without
+    ``values`` only positions ``0..size-1`` are drawn, so a set of millions
+    of keys never has to be copied.
+    """
+
+    ALIAS_MAX = 250_000
+
+    def __init__(self, values=None, weights=None, zipf: Optional[float] = None,
+                 size: Optional[int] = None):
+        if values is not None:
+            values = np.array(values)
+            if values.dtype.kind == "U":
+                # Object arrays share the strings instead of copying them
+                # into fixed-width unicode cells on every draw
+                values = values.astype(object)
+            # The sampler owns a read-only copy, so it stays valid however
+            # the caller's list changes afterwards
+            values.flags.writeable = False
+            size = len(values)
+        if not size:
+            raise ValueError("ChoiceSampler needs a non-empty choice set")
+        if weights is not None and zipf is not None:
+            raise ValueError("Use either weights or zipf, not both")
+
+        self.values = values
+        self.size = size
+        self.zipf = zipf
+        self.prob = self.alias = self.cdf = None
+        if weights is not None:
+            self._build_weights(weights)
+        if zipf is not None:
+            if zipf <= 0:
+                raise ValueError("zipf exponent must be positive")
+            # Popularity rank -> position through a fixed affine permutation,
+            # so the most popular items are spread over the set
+            step = max(1, int(size * 0.6180339887)) | 1
+            while np.gcd(step, size) != 1:
+                step += 2
+            self._rank_step, self._rank_shift = step, size // 3
+
+    def _build_weights(self, weights):
+        p = np.asarray(weights, dtype=float)
+        if len(p) != self.size:
+            raise ValueError("Number of weights must match number of categories")
+        if (p < 0).any() or not np.isclose(p.sum(), 1):
+            raise ValueError("Weights must be non-negative and sum to 1")
+
+        if self.size > self.ALIAS_MAX:
+            self.cdf = p.cumsum()
+            self.cdf /= self.cdf[-1]
+            return
+
+        # Vose's alias method: every slot keeps its own index with
+        # probability prob[i] and otherwise yields alias[i]
+        scaled = p * self.size / p.sum()
+        prob = np.ones(self.size)
+        alias = np.arange(self.size)
+        small = [i for i in range(self.size) if scaled[i] < 1]
+        large = [i for i in range(self.size) if scaled[i] >= 1]
+        while small and large:
+            lo, hi = small.pop(), large.pop()
+            prob[lo], alias[lo] = scaled[lo], hi
+            scaled[hi] -= 1 - scaled[lo]
+            (small if scaled[hi] < 1 else large).append(hi)
+        self.prob, self.alias = prob, alias
+
+    def positions(self, rng: np.random.Generator, n_rows: int) -> np.ndarray:
+        """Draw ``n_rows`` positions into the choice set"""
+        if self.zipf is not None:
+            # Inverse CDF of a power law on [1, size + 1), floored to ranks
+            u = rng.random(n_rows)
+            if self.zipf == 1:
+                x = (self.size + 1) ** u
+            else:
+                e = 1 - self.zipf
+                x = (((self.size + 1) ** e - 1) * u + 1) ** (1 / e)
+            ranks = np.minimum(x.astype(np.int64), self.size) - 1
+            return (ranks * self._rank_step + self._rank_shift) % self.size
+        if self.prob is not None:
+            # One uniform per draw supplies both the slot and the coin flip,
+            # so the first k draws do not depend on how many are made
+            scaled = rng.random(n_rows) * self.size
+            slots = scaled.astype(np.int64)
+            return np.where(scaled - slots < self.prob[slots], slots, self.alias[slots])
+        if self.cdf is not None:
+            return self.cdf.searchsorted(rng.random(n_rows), side="right")
+        return rng.integers(0, self.size, size=n_rows)
+
+    def sample(self, rng: np.random.Generator, n_rows: int) -> np.ndarray:
+        """Draw ``n_rows`` values from the choice set"""
+        return self.values[self.positions(rng, n_rows)]
+
+    @property
+    def dictionary(self) -> pa.Array:
+        """The choice set as an Arrow array, the dictionary of encoded output"""
+        if getattr(self, "_dictionary", None) is None:
+            self._dictionary = pa.array(self.values)
+        return self._dictionary
+
+    def encode(self, positions: np.ndarray) -> pa.DictionaryArray:
+        """Dictionary-encode drawn ``positions`` without materializing the values"""
+        return pa.DictionaryArray.from_arrays(
+            pa.array(positions, type=pa.int32()), self.dictionary)
+
+
+# Code points of "0000".."9999", so IDs are written four digits per lookup
+_DIGIT_BLOCKS = (np.arange(10000)[:, None] // 10 ** np.arange(3, -1, -1) % 10
+                 + ord("0")).astype("<u4")
+
+
+def sequential_ids(prefix: str, start: int, n_rows: int) -> np.ndarray:
+    """
+    Build ``f"{prefix}{start + i}"`` for ``i < n_rows`` without a per-row
+    Python call: the code points of every ID are written into a uint32
+    matrix, one run of equal digit count at a time, which is then viewed as
+    a NumPy unicode array (identical to the list-comprehension result).
+    """
+    if n_rows == 0 or start < 0:
+        return np.array([f"{prefix}{start + i}" for i in range(n_rows)])
+
+    stop = start + n_rows
+    width = len(prefix) + len(str(stop - 1))
+    chars = np.zeros((n_rows, width), dtype="<u4")
+    chars[:, :len(prefix)] = [ord(c) for c in prefix]
+
+    lo = start
+    while lo < stop:
+        n_digits = len(str(lo))
+        hi = min(stop, 10 ** n_digits)
+        rows = slice(lo - start, hi - start)
+        rest = np.arange(lo, hi, dtype=np.int64)
+        end = len(prefix) + n_digits
+        while end > len(prefix):
+            rest, block = np.divmod(rest, 10000)
+            take = min(4, end - len(prefix))
+            chars[rows, end - take:end] = _DIGIT_BLOCKS[block, 4 - take:]
+            end -= take
+        lo = hi
+    return chars.view(f"<U{width}").ravel()
+
+
+class ColumnPlan:
+    """
+    One resolved column of a DatasetPlan: either a fixed set of values
+    (choices or categories) with its ChoiceSampler, a column type
+    generator, or a function of other columns.
+    """
+
+    def __init__(self, name: str, stream_idx: int, col_type: str, distribution: Optional[str] = None,
+                 params: Optional[Dict] = None, sampler: Optional[ChoiceSampler] = None,
+                 sources: Optional[List[str]] = None,
+                 function: Optional[str] = None, multi_column: bool = False):
+        self.name = name
+        # Index of the column in the config; selects its random streams
+        self.stream_idx = stream_idx
+        self.col_type = col_type
+        self.distribution = distribution
+        self.params = params or {}
+        self.sampler = sampler
+        self.sources = sources or []
+        self.function = function
+        self.multi_column = multi_column
+
+    @property
+    def is_dependent(self) -> bool:
+        return bool(self.sources)
+
+    def generate(self, generator: "RandomDatasetGenerator", n_rows: int) -> np.ndarray:
+        """Draw ``n_rows`` values of an independent column from the generator's active stream"""
+        if self.sampler is None:
+            return generator.data_type_generators[self.col_type](
+                n_rows, self.distribution, self.params, None)
+        return self.sampler.sample(generator.rng, n_rows)
+
+    def derive(self, generator: "RandomDatasetGenerator", n_rows: int, data: Dict) -> np.ndarray:
+        """Compute a dependent column from the already generated ``data``"""
+        dependency_data = (tuple(data[source] for source in self.sources) if self.multi_column
+                           else data[self.sources[0]])
+        return generator._generate_dependent_column(
+            n_rows, self.col_type, dependency_data, self.function, self.params)
+
+
+class DatasetPlan:
+    """
+    A columns config parsed, validated and resolved once, so it can be
+    reused for every chunk, worker and run of a dataset.
+
+    Each column is resolved to a ColumnPlan: choice and category lists get
+    their ChoiceSampler (arrays, alias tables) up front, generator lookups
+    are checked, custom expressions are compiled, and ``depends_on`` columns
+    are ordered after the columns they read (in any config order). Build one
+    with ``RandomDatasetGenerator.plan(config)``; ``compile_seconds`` keeps
+    planning time apart from generation time.
+    """
+
+    DEPENDENCY_FUNCTIONS = ("transform", "map", "custom")
+
+    def __init__(self, columns_config: List[Dict], column_types=None, distributions=None):
+        start = time.perf_counter()
+        self.columns: List[ColumnPlan] = []
+        seen = set()
+        for stream_idx, col_config in enumerate(columns_config):
+            name = col_config.get("name")
+            if not name:
+                raise ValueError(f"Column {stream_idx} has no name")
+            if name in seen:
+                raise ValueError(f"Duplicate column name: {name}")
+            seen.add(name)
+            self.columns.append(self._resolve(
+                stream_idx, col_config, column_types, distributions))
+
+        self.names = [column.name for column in self.columns]
+        self._by_name = {column.name: column for column in self.columns}
+        self.order = self._topological_order()
+        self.compile_seconds = time.perf_counter() - start
+
+    def _resolve(self, stream_idx: int, col_config: Dict, column_types, distributions) -> ColumnPlan:
+        name = col_config["name"]
+        col_type = col_config.get("type")
+        params = col_config.get("params", {})
+        distribution = col_config.get("distribution", None)
+
+        if column_types is not None and col_type not in column_types:
+            raise ValueError(f"Unknown column type: {col_type}")
+
+        if "depends_on" in col_config:
+            dependency = col_config["depends_on"]
+            multi_column = "columns" in dependency
+            sources = list(dependency["columns"]) if multi_column else [dependency.get("column")]
+            function = dependency.get("function")
+            if not all(sources):
+                raise ValueError(f"Column {name} depends_on needs 'column' or 'columns'")
+            if function not in self.DEPENDENCY_FUNCTIONS:
+                raise ValueError(f"Unknown function type: {function}")
+            if function == "custom" and isinstance(params.get("function"), str):
+                _compile_expression(params["function"], len(sources))
+            return ColumnPlan(name, stream_idx, col_type, distribution, params,
+                              sources=sources, function=function, multi_column=multi_column)
+
+        if distribution and distributions is not None and distribution not in distributions:
+            raise ValueError(f"Unknown distribution: {distribution}")
+
+        # Every column type samples uniformly from explicit choices;
+        # category and custom columns also honour weights and zipf
+        choices = col_config.get("choices", None)
+        weighted = col_type in ("category", "custom")
+        if not choices and col_type == "category":
+            choices = params.get("categories", ["A", "B", "C"])
+        elif not choices and col_type == "custom" and params.get("choices"):
+            choices = params["choices"]
+        if choices is not None and len(choices):
+            try:
+                sampler = ChoiceSampler(
+                    choices, weights=params.get("weights") if weighted else None,
+                    zipf=params.get("zipf") if weighted else None)
+            except ValueError as e:
+                raise ValueError(f"Column {name}: {e}") from e
+            return ColumnPlan(name, stream_idx, col_type, distribution, params, sampler=sampler)
+
+        return ColumnPlan(name, stream_idx, col_type, distribution, params)
+
+    def column(self, name: str) -> ColumnPlan:
+        return self._by_name[name]
+
+    def _topological_order(self) -> List[ColumnPlan]:
+        """Independent columns first, then dependent ones once their sources exist"""
+        by_name = {column.name: column for column in self.columns}
+        for column in self.columns:
+            for source in column.sources:
+                if source not in by_name:
+                    raise ValueError(
+                        f"Column {column.name} depends on {source} which is not in the config")
+
+        order = [column for column in self.columns if not column.is_dependent]
+        done = {column.name for column in order}
+        remaining = [column for column in self.columns if column.is_dependent]
+        while remaining:
+            ready = [column for column in remaining if all(s in done for s in column.sources)]
+            if not ready:
+                raise ValueError(
+                    f"Circular depends_on between columns: {', '.join(c.name for c in remaining)}")
+            for column in ready:
+                order.append(column)
+                done.add(column.name)
+            remaining = [column for column in remaining if column.name not in done]
+        return order
 
 
 class RandomDatasetGenerator:
 
-    def __init__(self, seed: Optional[int] = None, locale: Union[str, List[str]] = 'en_US'):
+    # Faker vocabulary pools shared by every instance, keyed by
+    # (locale, seed, column type, params, pool size)
+    _pool_cache: Dict[tuple, np.ndarray] = {}
+
+    def __init__(
+        self,
+        seed: Optional[int] = None,
+        locale: Union[str, List[str]] = 'en_US',
+        pooled: bool = False,
+        pool_size: int = 10000,
+        block_size: int = 10000,
+        n_workers: int = 1,
+        shard_id: int = 0,
+        num_shards: int = 1,
+    ):
+        """
+        Args:
+            seed: Seed for reproducible output
+            locale: Faker locale(s)
+            pooled: Fill Faker-backed columns by sampling from a bounded
+                vocabulary pool instead of calling Faker once per row
+            pool_size: Number of distinct values per pool in pooled mode
+            block_size: Rows per independent random stream within a column
+            n_workers: Processes used to generate rows in parallel
+            shard_id: Which of ``num_shards`` disjoint row ranges this
+                generator produces
+            num_shards: Number of shards the rows of every dataset are split
+                into, e.g. one per Airflow worker or node
+        """
+        if not 0 <= shard_id < num_shards:
+            raise ValueError(
+                f"shard_id must be in [0, {num_shards}), got {shard_id}")
+        if n_workers < 1:
+            raise ValueError("n_workers must be a positive integer")
+
         self.seed = seed
-        if seed is not None:
-            np.random.seed(seed)
-            random.seed(seed)
+        self.locale = locale
+        self.pooled = pooled
+        self.pool_size = pool_size
+        self.block_size = block_size
+        self.n_workers = n_workers
+        self.shard_id = shard_id
+        self.num_shards = num_shards
+
+        # All randomness comes from child streams of one root SeedSequence;
+        # no global NumPy / random / Faker state is touched
+        self._entropy = np.random.SeedSequence(seed).entropy
+        # Worker processes rebuild the generator from these; passing the
+        # entropy as the seed keeps unseeded generators consistent too
+        self._init_kwargs = {
+            "seed": self._entropy, "locale": locale, "pooled": pooled,
+            "pool_size": pool_size, "block_size": block_size,
+        }
+        self._dataset_count = 0
+        self._spawn_count = 0
+        self._row_offset = 0
 
         self.faker = Faker(locale)
-        if seed is not None:
-            Faker.seed(seed)
-
+        self.faker.seed_instance(self._entropy)
+        self.rng = self.spawn_rng()
+        self._default_rng = self.rng
+        self._default_faker = self.faker
+        self._block_faker = Faker(locale)
+
+        # np.random.Generator distributions, resolved against the active
+        # column stream at call time
         self.distributions = {
-            "normal": np.random.normal,
-            "uniform": np.random.uniform,
-            "poisson": np.random.poisson,
-            "exponential": np.random.exponential,
-            "binomial": np.random.binomial,
-            "bernoulli": lambda p, size: np.random.binomial(1, p, size),
-            "lognormal": np.random.lognormal,
-            "pareto": np.random.pareto,
-            "geometric": np.random.geometric,
-            "gamma": np.random.gamma,
-            "beta": np.random.beta,
-            "weibull": np.random.weibull,
-            "chisquare": np.random.chisquare,
-            "rayleigh": np.random.rayleigh,
-            "zipf": np.random.zipf
+            "normal": self._rng_method("normal"),
+            "uniform": self._rng_method("uniform"),
+            "poisson": self._rng_method("poisson"),
+            "exponential": self._rng_method("exponential"),
+            "binomial": self._rng_method("binomial"),
+            "bernoulli": lambda p, size: self.rng.binomial(1, p, size),
+            "lognormal": self._rng_method("lognormal"),
+            "pareto": self._rng_method("pareto"),
+            "geometric": self._rng_method("geometric"),
+            "gamma": self._rng_method("gamma"),
+            "beta": self._rng_method("beta"),
+            "weibull": self._rng_method("weibull"),
+            "chisquare": self._rng_method("chisquare"),
+            "rayleigh": self._rng_method("rayleigh"),
+            "zipf": self._rng_method("zipf")
         }
 
         # Common data type generators
@@ -47,118 +513,209 @@ class RandomDatasetGenerator:
 
             # Person related
             "name": self._generate_names,
-            "first_name": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: np.array([self.faker.first_name() for _ in range(n)])),
-            "last_name": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: np.array([self.faker.last_name() for _ in range(n)])),
-            "prefix": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: np.array([self.faker.prefix() for _ in range(n)])),
-            "suffix": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: np.array([self.faker.suffix() for _ in range(n)])),
-            "gender": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: np.array([self.faker.random_element(elements=('M', 'F', 'NB')) for _ in range(n)])),
-            "age": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: np.array([self.faker.random_int(**p) if p else self.faker.random_int(min=18, max=90) for _ in range(n)])),
-            "birthdate": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: np.array([self.faker.date_of_birth(**p) if p else self.faker.date_of_birth() for _ in range(n)])),
-            "ssn": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: np.array([self.faker.ssn() for _ in range(n)])),
+            "first_name": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: self._faker_column("first_name", n, p, lambda f: f.first_name())),
+            "last_name": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: self._faker_column("last_name", n, p, lambda f: f.last_name())),
+            "prefix": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: self._faker_column("prefix", n, p, lambda f: f.prefix())),
+            "suffix": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: self._faker_column("suffix", n, p, lambda f: f.suffix())),
+            "gender": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: self._faker_column("gender", n, p, lambda f: f.random_element(elements=('M', 'F', 'NB')))),
+            "age": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: self._faker_column("age", n, p, lambda f: f.random_int(**p) if p else f.random_int(min=18, max=90))),
+            "birthdate": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: self._faker_column("birthdate", n, p, lambda f: f.date_of_birth(**p) if p else f.date_of_birth())),
+            "ssn": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: self._faker_column("ssn", n, p, lambda f: f.ssn())),
 
             # Internet related
-            "email": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: np.array([self.faker.email() for _ in range(n)])),
-            "username": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: np.array([self.faker.user_name() for _ in range(n)])),
-            "password": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: np.array([self.faker.password(**p) if p else self.faker.password() for _ in range(n)])),
-            "domain": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: np.array([self.faker.domain_name() for _ in range(n)])),
-            "url": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: np.array([self.faker.url() for _ in range(n)])),
-            "ipv4": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: np.array([self.faker.ipv4() for _ in range(n)])),
-            "ipv6": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: np.array([self.faker.ipv6() for _ in range(n)])),
-            "mac_address": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: np.array([self.faker.mac_address() for _ in range(n)])),
-            "user_agent": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: np.array([self.faker.user_agent() for _ in range(n)])),
+            "email": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: self._faker_column("email", n, p, lambda f: f.email())),
+            "username": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: self._faker_column("username", n, p, lambda f: f.user_name())),
+            "password": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: self._faker_column("password", n, p, lambda f: f.password(**p) if p else f.password())),
+            "domain": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: self._faker_column("domain", n, p, lambda f: f.domain_name())),
+            "url": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: self._faker_column("url", n, p, lambda f: f.url())),
+            "ipv4": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: self._faker_column("ipv4", n, p, lambda f: f.ipv4())),
+            "ipv6": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: self._faker_column("ipv6", n, p, lambda f: f.ipv6())),
+            "mac_address": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: self._faker_column("mac_address", n, p, lambda f: f.mac_address())),
+            "user_agent": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: self._faker_column("user_agent", n, p, lambda f: f.user_agent())),
 
             # Address related
-            "address": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: np.array([self.faker.address() for _ in range(n)])),
-            "street_address": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: np.array([self.faker.street_address() for _ in range(n)])),
-            "city": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: np.array([self.faker.city() for _ in range(n)])),
-            "state": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: np.array([self.faker.state() for _ in range(n)])),
-            "state_abbr": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: np.array([self.faker.state_abbr() for _ in range(n)])),
-            "zipcode": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: np.array([self.faker.zipcode() for _ in range(n)])),
-            "country": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: np.array([self.faker.country() for _ in range(n)])),
-            "country_code": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: np.array([self.faker.country_code() for _ in range(n)])),
-            "latitude": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: np.array([float(self.faker.latitude()) for _ in range(n)])),
-            "longitude": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: np.array([float(self.faker.longitude()) for _ in range(n)])),
-            "coordinates": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: np.array([f"{self.faker.latitude()}, {self.faker.longitude()}" for _ in range(n)])),
+            "address": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: self._faker_column("address", n, p, lambda f: f.address())),
+            "street_address": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: self._faker_column("street_address", n, p, lambda f: f.street_address())),
+            "city": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: self._faker_column("city", n, p, lambda f: f.city())),
+            "state": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: self._faker_column("state", n, p, lambda f: f.state())),
+            "state_abbr": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: self._faker_column("state_abbr", n, p, lambda f: f.state_abbr())),
+            "zipcode": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: self._faker_column("zipcode", n, p, lambda f: f.zipcode())),
+            "country": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: self._faker_column("country", n, p, lambda f: f.country())),
+            "country_code": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: self._faker_column("country_code", n, p, lambda f: f.country_code())),
+            "latitude": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: self._faker_column("latitude", n, p, lambda f: float(f.latitude()))),
+            "longitude": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: self._faker_column("longitude", n, p, lambda f: float(f.longitude()))),
+            "coordinates": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: self._faker_column("coordinates", n, p, lambda f: f"{f.latitude()}, {f.longitude()}")),
 
             # Phone related
-            "phone_number": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: np.array([self.faker.phone_number() for _ in range(n)])),
-            "msisdn": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: np.array([self.faker.msisdn() for _ in range(n)])),
-            "international_phone": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: np.array([self.faker.phone_number() for _ in range(n)])),
+            "phone_number": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: self._faker_column("phone_number", n, p, lambda f: f.phone_number())),
+            "msisdn": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: self._faker_column("msisdn", n, p, lambda f: f.msisdn())),
+            "international_phone": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: self._faker_column("international_phone", n, p, lambda f: f.phone_number())),
 
             # Company related
-            "company": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: np.array([self.faker.company() for _ in range(n)])),
-            "company_suffix": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: np.array([self.faker.company_suffix() for _ in range(n)])),
-            "job": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: np.array([self.faker.job() for _ in range(n)])),
-            "industry": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: np.array([self.faker.job() for _ in range(n)])),
+            "company": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: self._faker_column("company", n, p, lambda f: f.company())),
+            "company_suffix": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: self._faker_column("company_suffix", n, p, lambda f: f.company_suffix())),
+            "job": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: self._faker_column("job", n, p, lambda f: f.job())),
+            "industry": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: self._faker_column("industry", n, p, lambda f: f.job())),
 
             # Financial
-            "credit_card_number": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: np.array([self.faker.credit_card_number(**p) if p else self.faker.credit_card_number() for _ in range(n)])),
-            "credit_card_provider": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: np.array([self.faker.credit_card_provider() for _ in range(n)])),
-            "credit_card_expire": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: np.array([self.faker.credit_card_expire() for _ in range(n)])),
-            "credit_card_security_code": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: np.array([self.faker.credit_card_security_code() for _ in range(n)])),
-            "currency_code": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: np.array([self.faker.currency_code() for _ in range(n)])),
-            "currency_name": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: np.array([self.faker.currency_name() for _ in range(n)])),
+            "credit_card_number": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: self._faker_column("credit_card_number", n, p, lambda f: f.credit_card_number(**p) if p else f.credit_card_number())),
+            "credit_card_provider": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: self._faker_column("credit_card_provider", n, p, lambda f: f.credit_card_provider())),
+            "credit_card_expire": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: self._faker_column("credit_card_expire", n, p, lambda f: f.credit_card_expire())),
+            "credit_card_security_code": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: self._faker_column("credit_card_security_code", n, p, lambda f: f.credit_card_security_code())),
+            "currency_code": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: self._faker_column("currency_code", n, p, lambda f: f.currency_code())),
+            "currency_name": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: self._faker_column("currency_name", n, p, lambda f: f.currency_name())),
 
             # Text content
-            "text": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: np.array([self.faker.text(**p) if p else self.faker.text() for _ in range(n)])),
-            "paragraph": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: np.array([self.faker.paragraph(**p) if p else self.faker.paragraph() for _ in range(n)])),
-            "sentence": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: np.array([self.faker.sentence(**p) if p else self.faker.sentence() for _ in range(n)])),
-            "word": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: np.array([self.faker.word() for _ in range(n)])),
+            "text": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: self._faker_column("text", n, p, lambda f: f.text(**p) if p else f.text())),
+            "paragraph": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: self._faker_column("paragraph", n, p, lambda f: f.paragraph(**p) if p else f.paragraph())),
+            "sentence": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: self._faker_column("sentence", n, p, lambda f: f.sentence(**p) if p else f.sentence())),
+            "word": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: self._faker_column("word", n, p, lambda f: f.word())),
 
             # Color
-            "color_name": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: np.array([self.faker.color_name() for _ in range(n)])),
-            "hex_color": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: np.array([self.faker.hex_color() for _ in range(n)])),
-            "rgb_color": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: np.array([self.faker.rgb_color() for _ in range(n)])),
+            "color_name": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: self._faker_column("color_name", n, p, lambda f: f.color_name())),
+            "hex_color": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: self._faker_column("hex_color", n, p, lambda f: f.hex_color())),
+            "rgb_color": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: self._faker_column("rgb_color", n, p, lambda f: f.rgb_color())),
 
             # Various identifiers
-            "uuid4": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: np.array([str(self.faker.uuid4()) for _ in range(n)])),
-            "isbn10": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: np.array([self.faker.isbn10() for _ in range(n)])),
-            "isbn13": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: np.array([self.faker.isbn13() for _ in range(n)])),
-            "ean8": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: np.array([self.faker.ean8() for _ in range(n)])),
-            "ean13": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: np.array([self.faker.ean13() for _ in range(n)])),
+            "uuid4": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: self._generate_uuid4(n)),
+            "isbn10": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: self._faker_column("isbn10", n, p, lambda f: f.isbn10())),
+            "isbn13": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: self._faker_column("isbn13", n, p, lambda f: f.isbn13())),
+            "ean8": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: self._faker_column("ean8", n, p, lambda f: f.ean8())),
+            "ean13": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: self._faker_column("ean13", n, p, lambda f: f.ean13())),
 
             # Dates and times
-            "date": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: np.array([self.faker.date(**p) if p else self.faker.date() for _ in range(n)])),
-            "time": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: np.array([self.faker.time() for _ in range(n)])),
-            "day_of_week": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: np.array([self.faker.day_of_week() for _ in range(n)])),
-            "month_name": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: np.array([self.faker.month_name() for _ in range(n)])),
-            "timezone": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: np.array([self.faker.timezone() for _ in range(n)])),
+            "date": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: self._faker_column("date", n, p, lambda f: f.date(**p) if p else f.date())),
+            "time": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: self._faker_column("time", n, p, lambda f: f.time())),
+            "day_of_week": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: self._faker_column("day_of_week", n, p, lambda f: f.day_of_week())),
+            "month_name": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: self._faker_column("month_name", n, p, lambda f: f.month_name())),
+            "timezone": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: self._faker_column("timezone", n, p, lambda f: f.timezone())),
 
             # Miscellaneous
-            "file_path": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: np.array([self.faker.file_path(**p) if p else self.faker.file_path() for _ in range(n)])),
-            "file_name": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: np.array([self.faker.file_name() for _ in range(n)])),
-            "mime_type": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: np.array([self.faker.mime_type() for _ in range(n)])),
-            "image_url": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: np.array([self.faker.image_url() for _ in range(n)])),
-            "user_name": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: np.array([self.faker.user_name() for _ in range(n)])),
-            "emoji": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: np.array([self.faker.emoji() for _ in range(n)])),
+            "file_path": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: self._faker_column("file_path", n, p, lambda f: f.file_path(**p) if p else f.file_path())),
+            "file_name": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: self._faker_column("file_name", n, p, lambda f: f.file_name())),
+            "mime_type": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: self._faker_column("mime_type", n, p, lambda f: f.mime_type())),
+            "image_url": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: self._faker_column("image_url", n, p, lambda f: f.image_url())),
+            "user_name": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: self._faker_column("user_name", n, p, lambda f: f.user_name())),
+            "emoji": lambda n, d, p, c: self._apply_choices_or_generate(n, c, lambda: self._faker_column("emoji", n, p, lambda f: f.emoji())),
 
             # Custom generator for full flexibility
             "custom": self._generate_custom,
         }
 
+    def _rng_method(self, name: str):
+        """Return a callable that forwards to ``name`` on the active stream"""
+        return lambda *args, **kwargs: getattr(self.rng, name)(*args, **kwargs)
+
     def _apply_choices_or_generate(self, n_rows: int, choices: Optional[List], generator_func):
         """Apply choices if provided, otherwise use the generator function"""
         if choices:
-            return np.random.choice(choices, size=n_rows)
+            return self._sample_choices(choices, n_rows)
         else:
             return generator_func()
 
+    def _sample_choices(self, choices, n_rows: int, weights=None, zipf: Optional[float] = None) -> np.ndarray:
+        """
+        Sample from ``choices``. Pass a ChoiceSampler built once (as
+        DatasetPlan does per column) to reuse its tables across calls; a
+        plain list is converted on every call.
+        """
+        if isinstance(choices, ChoiceSampler):
+            return choices.sample(self.rng, n_rows)
+        return ChoiceSampler(choices, weights=weights, zipf=zipf).sample(self.rng, n_rows)
+
+    def _faker_column(self, col_type: str, n_rows: int, params: Dict, faker_func) -> np.ndarray:
+        """
+        Build a column from a per-row Faker call.
+
+        In pooled mode the Faker call is made ``pool_size`` times to build a
+        vocabulary pool (once per locale/seed/type/params) and the column is
+        filled by sampling pool indices with NumPy.
+        """
+        if not self.pooled:
+            return np.array([faker_func(self.faker) for _ in range(n_rows)])
+
+        pool = self._get_pool(col_type, params, faker_func)
+        return pool[self.rng.integers(0, len(pool), size=n_rows)]
+
+    def _get_pool(self, col_type: str, params: Dict, faker_func) -> np.ndarray:
+        """Return the cached vocabulary pool for a Faker-backed column type"""
+        locale_key = tuple(self.locale) if isinstance(
+            self.locale, list) else self.locale
+        params_key = tuple(sorted((k, repr(v)) for k, v in params.items()))
+        key = (locale_key, self._entropy, col_type, params_key, self.pool_size)
+
+        pool = self._pool_cache.get(key)
+        if pool is None:
+            # A dedicated Faker keeps the pool independent of how much the
+            # main instance has been used, so it is identical per locale/seed
+            pool_faker = Faker(self.locale)
+            pool_faker.seed_instance(self._entropy)
+            pool = np.array([faker_func(pool_faker)
+                            for _ in range(self.pool_size)])
+            if pool.dtype.kind == "U":
+                # Object arrays share the pooled strings instead of copying
+                # them into fixed-width unicode cells on every draw
+                pool = pool.astype(object)
+            self._pool_cache[key] = pool
+        return pool
+
+    def _generate_uuid4(self, n_rows: int) -> np.ndarray:
+        """
+        Generate random UUID4 strings.
+
+        Pooling would repeat identifiers, so pooled mode instead draws the raw
+        random bytes in bulk and formats them with vectorized byte operations.
+        """
+        if not self.pooled:
+            return np.array([str(self.faker.uuid4()) for _ in range(n_rows)])
+        if n_rows == 0:
+            return np.array([], dtype=object)
+
+        raw = np.frombuffer(self.rng.bytes(16 * n_rows),
+                            dtype=np.uint8).reshape(n_rows, 16).copy()
+        raw[:, 6] = (raw[:, 6] & 0x0F) | 0x40  # version 4
+        raw[:, 8] = (raw[:, 8] & 0x3F) | 0x80  # RFC 4122 variant
+
+        hex_chars = np.frombuffer(binascii.hexlify(raw.tobytes()),
+                                  dtype="S1").reshape(n_rows, 32)
+        out = np.full((n_rows, 36), b"-", dtype="S1")
+        out[:, np.r_[0:8, 9:13, 14:18, 19:23, 24:36]] = hex_chars
+        return out.view("S36").ravel().astype(str).astype(object)
+
+    def plan(self, columns_config: Union[List[Dict], DatasetPlan]) -> DatasetPlan:
+        """
+        Compile ``columns_config`` into a DatasetPlan, validated against this
+        generator's column types and distributions. Pass the plan instead of
+        the config to reuse it across calls.
+        """
+        if isinstance(columns_config, DatasetPlan):
+            return columns_config
+        return DatasetPlan(columns_config, self.data_type_generators, self.distributions)
+
     def generate_dataset(
         self,
         n_rows: int,
-        columns_config: List[Dict],
+        columns_config: Union[List[Dict], DatasetPlan],
         include_index: bool = True,
-    ) -> pd.DataFrame:
+        output: str = "pandas",
+    ) -> Union[pd.DataFrame, pa.Table]:
         """
         Generate a random dataset based on the provided configuration.
 
+        With ``num_shards`` > 1 only this shard's rows are generated (see
+        ``shard_range``); with ``n_workers`` > 1 the rows are generated in a
+        process pool. For a given seed the output is identical either way.
+
         Args:
             n_rows: Number of rows to generate
-            columns_config: List of column configurations
+            columns_config: List of column configurations, or a DatasetPlan
             include_index: Whether to include a default index (True) or create a custom one
+            output: "pandas" for a DataFrame, or "arrow" for a pyarrow.Table in
+                which category columns are dictionary-encoded and strings live
+                in Arrow buffers (``include_index`` does not apply)
 
         Returns:
-            Pandas DataFrame with random data
+            Pandas DataFrame (or pyarrow.Table) with random data
 
         Example:
             >>> config = [
@@ -171,56 +728,206 @@ class RandomDatasetGenerator:
             >>> generator = RandomDatasetGenerator(seed=42)
             >>> df = generator.generate_dataset(n_rows=100, columns_config=config)
         """
-        data = {}
+        self._check_output(output)
+        plan = self.plan(columns_config)
+        dataset_id = self._next_dataset_id()
+        start, stop = self.shard_range(n_rows)
 
-        for col_config in columns_config:
-            col_name = col_config["name"]
-            col_type = col_config["type"]
-            params = col_config.get("params", {})
-            choices = col_config.get("choices", None)
+        if self.n_workers == 1:
+            parts = [self._generate_chunk(stop - start, start, plan, dataset_id, include_index, output)]
+        else:
+            ranges = self._split_range(start, stop, self.n_workers)
+            with ProcessPoolExecutor(max_workers=self.n_workers) as executor:
+                futures = [
+                    executor.submit(_generate_rows_worker, self._init_kwargs, dataset_id,
+                                    plan, lo, hi, include_index, output)
+                    for lo, hi in ranges
+                ]
+                parts = [future.result() for future in futures]
+
+        if output == "arrow":
+            return pa.Table.from_batches(parts)
+        return parts[0] if len(parts) == 1 else pd.concat(parts)
+
+    def generate_dataset_iter(
+        self,
+        n_rows: int,
+        columns_config: Union[List[Dict], DatasetPlan],
+        chunk_size: int = 100000,
+        include_index: bool = True,
+        output: str = "pandas",
+    ) -> Iterator[Union[pd.DataFrame, pa.RecordBatch]]:
+        """
+        Generate a random dataset as a stream of DataFrames (or, with
+        ``output="arrow"``, pyarrow.RecordBatches) of at most ``chunk_size``
+        rows, so peak memory is bounded by the chunk size.
 
-            if "depends_on" in col_config:
-                dependency = col_config["depends_on"]
-                if dependency["column"] not in data:
-                    raise ValueError(
-                        f"Column {col_name} depends on {dependency['column']} which hasn't been generated yet")
+        Rows are drawn from per-column, per-block random streams and
+        sequential custom IDs continue from one chunk to the next, so for a
+        given seed the concatenated chunks equal a single ``generate_dataset``
+        call with the same arguments. Chunk sizes that are a multiple of
+        ``block_size`` avoid redrawing the block shared by two chunks.
 
-                dependency_data = data[dependency["column"]]
-                data[col_name] = self._generate_dependent_column(
-                    n_rows, col_type, dependency_data, dependency["function"], params
-                )
-                continue
+        Example:
+            >>> generator = RandomDatasetGenerator(seed=42)
+            >>> for chunk in generator.generate_dataset_iter(10_000_000, config, chunk_size=500_000):
+            ...     chunk.to_csv(out, header=False, index=False)
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be a positive integer")
+
+        self._check_output(output)
+        plan = self.plan(columns_config)
+        dataset_id = self._next_dataset_id()
+        start, stop = self.shard_range(n_rows)
+        ranges = [(lo, min(lo + chunk_size, stop))
+                  for lo in range(start, stop, chunk_size)]
+
+        if self.n_workers == 1:
+            for lo, hi in ranges:
+                yield self._generate_chunk(hi - lo, lo, plan, dataset_id, include_index, output)
+            return
+
+        # Keep at most n_workers chunks in flight so memory stays bounded,
+        # and yield them in row order
+        with ProcessPoolExecutor(max_workers=self.n_workers) as executor:
+            pending = []
+            for lo, hi in ranges:
+                pending.append(executor.submit(
+                    _generate_rows_worker, self._init_kwargs, dataset_id,
+                    plan, lo, hi, include_index, output))
+                if len(pending) >= self.n_workers:
+                    yield pending.pop(0).result()
+            for future in pending:
+                yield future.result()
+
+    @staticmethod
+    def _check_output(output: str):
+        if output not in ("pandas", "arrow"):
+            raise ValueError(f"Unknown output: {output} (expected 'pandas' or 'arrow')")
+
+    def shard_range(self, n_rows: int) -> tuple:
+        """
+        Return the ``(start, stop)`` rows of an ``n_rows`` dataset that belong
+        to this generator's shard.
 
-            if col_type in self.data_type_generators:
-                distribution = col_config.get("distribution", None)
-
-                # Check if the generator expects choices parameter
-                generator = self.data_type_generators[col_type]
-                try:
-                    # Try to call with choices parameter
-                    data[col_name] = generator(
-                        n_rows, distribution, params, choices)
-                except TypeError:
-                    # Fallback for generators that don't support choices
-                    if choices:
-                        data[col_name] = np.random.choice(choices, size=n_rows)
-                    else:
-                        data[col_name] = generator(
-                            n_rows, distribution, params)
-            else:
-                raise ValueError(f"Unknown column type: {col_type}")
+        Rows keep their global position inside a shard, so sequential custom
+        IDs (``CUST-``, ``ORD_``, ``PROD_``, ...) never overlap between shards
+        and the shards of a seeded dataset concatenate to the unsharded one.
+        """
+        start = n_rows * self.shard_id // self.num_shards
+        stop = n_rows * (self.shard_id + 1) // self.num_shards
+        return start, stop
+
+    def _split_range(self, start: int, stop: int, parts: int) -> List[tuple]:
+        """Split ``start:stop`` into about ``parts`` block-aligned row ranges"""
+        blocks = -(-(stop - start) // (parts * self.block_size))
+        step = max(1, blocks) * self.block_size
+        bounds = [start] + list(range((start // step + 1) * step, stop, step)) + [stop]
+        return [(lo, hi) for lo, hi in zip(bounds, bounds[1:]) if hi > lo] or [(start, stop)]
+
+    def spawn_rng(self) -> np.random.Generator:
+        """
+        Return a new independent ``np.random.Generator`` spawned from this
+        generator's root seed, for draws made outside of ``generate_dataset``.
+        """
+        seq = np.random.SeedSequence(
+            self._entropy, spawn_key=(1, self._spawn_count))
+        self._spawn_count += 1
+        return np.random.Generator(np.random.PCG64(seq))
+
+    def _next_dataset_id(self) -> int:
+        dataset_id = self._dataset_count
+        self._dataset_count += 1
+        return dataset_id
+
+    def _block_stream(self, dataset_id: int, stream_idx: int, block_idx: int) -> tuple:
+        """
+        Return the (Generator, Faker) pair for one block of one column.
+
+        Every block of every column is its own child of the root
+        ``SeedSequence`` (spawn key: dataset, column, block), so a row's
+        values depend only on its position and never on how the rows are
+        split into chunks, threads or processes.
+        """
+        seq = np.random.SeedSequence(
+            self._entropy, spawn_key=(0, dataset_id, stream_idx, block_idx))
+        faker_seed = seq.spawn(1)[0].generate_state(1, np.uint64)[0]
+        self._block_faker.seed_instance(int(faker_seed))
+        return np.random.Generator(np.random.PCG64(seq)), self._block_faker
 
-        df = pd.DataFrame(data)
+    def _generate_blocks(self, dataset_id: int, stream_idx: int, start: int, stop: int, func) -> np.ndarray:
+        """
+        Build rows ``start:stop`` of one column by calling ``func(n)`` on the
+        stream of every block the range touches. ``func`` always draws from
+        the start of its block, so a block shared by two chunks yields the
+        same values in both.
+        """
+        if stop <= start:
+            self.rng, self.faker = self._block_stream(
+                dataset_id, stream_idx, start // self.block_size)
+            return func(0)
+
+        parts = []
+        for block_idx in range(start // self.block_size, (stop - 1) // self.block_size + 1):
+            block_start = block_idx * self.block_size
+            lo = max(start, block_start) - block_start
+            hi = min(stop, block_start + self.block_size) - block_start
+
+            self.rng, self.faker = self._block_stream(
+                dataset_id, stream_idx, block_idx)
+            self._row_offset = block_start
+            parts.append(func(hi)[lo:])
+        return parts[0] if len(parts) == 1 else np.concatenate(parts)
+
+    def _generate_chunk(
+        self,
+        n_rows: int,
+        offset: int,
+        plan: DatasetPlan,
+        dataset_id: int,
+        include_index,
+        output: str = "pandas",
+    ) -> Union[pd.DataFrame, pa.RecordBatch]:
+        """Generate ``n_rows`` rows starting at row ``offset`` of the dataset"""
+        data = {}
+        # Arrow output keeps sampled columns as positions into their choices
+        codes = {}
+        stop = offset + n_rows
 
-        # Handle index
-        if not include_index or isinstance(include_index, dict):
+        try:
+            for column in plan.order:
+                if column.is_dependent:
+                    for source in column.sources:
+                        if source not in data:
+                            data[source] = plan.column(source).sampler.values[codes[source]]
+                    data[column.name] = column.derive(self, n_rows, data)
+                    continue
+
+                if output == "arrow" and column.sampler is not None:
+                    codes[column.name] = self._generate_blocks(
+                        dataset_id, column.stream_idx, offset, stop,
+                        lambda n, column=column: column.sampler.positions(self.rng, n))
+                    continue
+
+                data[column.name] = self._generate_blocks(
+                    dataset_id, column.stream_idx, offset, stop,
+                    lambda n, column=column: column.generate(self, n))
+
+            if output == "arrow":
+                return self._record_batch(plan, data, codes)
+
+            df = pd.DataFrame({name: data[name] for name in plan.names},
+                              index=pd.RangeIndex(offset, stop))
+
+            # Handle index
             if isinstance(include_index, dict):
                 index_config = include_index
                 index_type = index_config.get("type", "range")
 
                 if index_type == "range":
-                    start = index_config.get("start", 1)
                     step = index_config.get("step", 1)
+                    start = index_config.get("start", 1) + offset * step
                     df.index = range(start, start + n_rows * step, step)
                 elif index_type == "datetime":
                     start_date = index_config.get("start", datetime.now())
@@ -228,21 +935,37 @@ class RandomDatasetGenerator:
                         start_date = datetime.fromisoformat(start_date)
                     freq = index_config.get("freq", "D")
                     df.index = pd.date_range(
-                        start=start_date, periods=n_rows, freq=freq)
+                        start=start_date, periods=stop, freq=freq)[offset:]
                 elif index_type == "uuid":
-                    df.index = [str(self.faker.uuid4()) for _ in range(n_rows)]
+                    df.index = self._generate_blocks(
+                        dataset_id, len(plan.columns), offset, stop, self._generate_uuid4)
                 elif index_type == "custom":
                     custom_index = index_config.get("values")
-                    if custom_index and len(custom_index) >= n_rows:
-                        df.index = custom_index[:n_rows]
+                    if custom_index and len(custom_index) >= stop:
+                        df.index = custom_index[offset:stop]
                     else:
                         raise ValueError(
                             "Custom index must have at least n_rows values")
-            else:
-                df.reset_index(drop=True, inplace=True)
+        finally:
+            self.rng, self.faker = self._default_rng, self._default_faker
+            self._row_offset = 0
 
         return df
 
+    @staticmethod
+    def _record_batch(plan: DatasetPlan, data: Dict, codes: Dict) -> pa.RecordBatch:
+        """Assemble Arrow output: sampled columns dictionary-encoded, the rest converted once"""
+        arrays = []
+        for column in plan.columns:
+            if column.name in codes:
+                arrays.append(column.sampler.encode(codes[column.name]))
+                continue
+            array = pa.array(data[column.name])
+            if column.col_type == "category" and pa.types.is_string(array.type):
+                array = array.dictionary_encode()
+            arrays.append(array)
+        return pa.RecordBatch.from_arrays(arrays, names=plan.names)
+
     def _generate_from_distribution(
         self, distribution: str, n_rows: int, params: Dict
     ) -> np.ndarray:
@@ -284,7 +1007,7 @@ class RandomDatasetGenerator:
     ) -> np.ndarray:
         """Generate integer values"""
         if choices:
-            return np.random.choice(choices, size=n_rows)
+            return self._sample_choices(choices, n_rows)
 
         if distribution:
             # Generate using specified distribution then convert to integers
@@ -295,113 +1018,124 @@ class RandomDatasetGenerator:
             # Handle both 'min'/'max' and 'low'/'high' parameters for compatibility
             min_val = params.get("min", params.get("low", 0))
             max_val = params.get("max", params.get("high", 100))
-            return np.random.randint(min_val, max_val + 1, size=n_rows)
+            return self.rng.integers(min_val, max_val + 1, size=n_rows)
 
     def _generate_floats(
         self, n_rows: int, distribution: Optional[str], params: Dict, choices: Optional[List] = None
     ) -> np.ndarray:
         """Generate float values"""
         if choices:
-            return np.random.choice(choices, size=n_rows)
+            return self._sample_choices(choices, n_rows)
 
         if distribution:
             return self._generate_from_distribution(distribution, n_rows, params)
         else:
             min_val = params.get("min", params.get("low", 0.0))
             max_val = params.get("max", params.get("high", 1.0))
-            return np.random.uniform(min_val, max_val, size=n_rows)
+            return self.rng.uniform(min_val, max_val, size=n_rows)
 
     def _generate_booleans(
         self, n_rows: int, distribution: Optional[str], params: Dict, choices: Optional[List] = None
     ) -> np.ndarray:
         """Generate boolean values"""
         if choices:
-            return np.random.choice(choices, size=n_rows)
+            return self._sample_choices(choices, n_rows)
 
         p_true = params.get("p_true", 0.5)
-        return np.random.random(size=n_rows) < p_true
+        return self.rng.random(size=n_rows) < p_true
 
     def _generate_categories(
         self, n_rows: int, distribution: Optional[str], params: Dict, choices: Optional[List] = None
     ) -> np.ndarray:
         """Generate categorical values"""
-        if choices:
-            weights = params.get("weights", None)
-            return np.random.choice(choices, size=n_rows, p=weights)
-
-        categories = params.get("categories", ["A", "B", "C"])
-        weights = params.get("weights", None)
-
-        if weights and len(weights) != len(categories):
-            raise ValueError(
-                "Number of weights must match number of categories")
-        return np.random.choice(categories, size=n_rows, p=weights)
+        categories = choices if choices else params.get("categories", ["A", "B", "C"])
+        return self._sample_choices(
+            categories, n_rows, params.get("weights", None), params.get("zipf", None))
 
     def _generate_datetimes(
         self, n_rows: int, distribution: Optional[str], params: Dict, choices: Optional[List] = None
     ) -> np.ndarray:
-        """Generate datetime values"""
+        """
+        Generate datetime64[us] values between ``start`` and ``end``.
+
+        Without a distribution the values are uniform over the range. With
+        one, the remaining params go to that distribution and its draws are
+        read as positions in the range (0 = start, 1 = end), e.g.
+        ``"distribution": "normal", "params": {"loc": 0.5, "scale": 0.1}``
+        for a mid-range peak. With ``"unit": "D"`` (or "h", "m", "s") the
+        draws are offsets from ``start`` in that unit instead, e.g.
+        exponential arrivals with ``{"scale": 3, "unit": "D"}``. Draws that
+        fall outside the range are redrawn.
+        """
         if choices:
-            return np.random.choice(choices, size=n_rows)
-
-        start_date = params.get("start", "2020-01-01T00:00:00")
-        end_date = params.get("end", "2025-01-01T00:00:00")
-
-        # Convert string dates to datetime objects if needed
-        if isinstance(start_date, str):
-            start_date = datetime.fromisoformat(start_date)
-        if isinstance(end_date, str):
-            end_date = datetime.fromisoformat(end_date)
-
-        if distribution:
-            # Use Faker's date_time_between for more control
-            return np.array([
-                self.faker.date_time_between(
-                    start_date=start_date, end_date=end_date)
-                for _ in range(n_rows)
-            ])
-        else:
-            # Calculate time range in seconds
-            time_range = (end_date - start_date).total_seconds()
-
-            # Generate random timestamps within the range
-            random_seconds = np.random.uniform(0, time_range, size=n_rows)
-            return np.array([start_date + timedelta(seconds=sec) for sec in random_seconds])
+            return self._sample_choices(choices, n_rows)
+
+        start = np.datetime64(params.get("start", "2020-01-01T00:00:00"), "us")
+        end = np.datetime64(params.get("end", "2025-01-01T00:00:00"), "us")
+        span = int((end - start).astype(np.int64))
+
+        if not distribution:
+            offsets = self.rng.integers(0, span + 1, size=n_rows)
+            return start + offsets.astype("timedelta64[us]")
+
+        dist_params = {key: value for key, value in params.items()
+                       if key not in ("start", "end", "unit")}
+        unit = params.get("unit")
+        scale = (span if unit is None
+                 else np.timedelta64(1, unit).astype("timedelta64[us]").astype(np.int64))
+
+        offsets = self._generate_from_distribution(distribution, n_rows, dist_params) * scale
+        outside = (offsets < 0) | (offsets > span)
+        for _ in range(10):
+            if not outside.any():
+                break
+            offsets[outside] = self._generate_from_distribution(
+                distribution, int(outside.sum()), dist_params) * scale
+            outside = (offsets < 0) | (offsets > span)
+        # Heavy tails that keep missing the range end up on its edges
+        offsets = np.clip(offsets, 0, span)
+        return start + offsets.astype(np.int64).astype("timedelta64[us]")
 
     def _generate_names(
         self, n_rows: int, distribution: Optional[str], params: Dict, choices: Optional[List] = None
     ) -> np.ndarray:
         """Generate names using Faker"""
         if choices:
-            return np.random.choice(choices, size=n_rows)
+            return self._sample_choices(choices, n_rows)
 
         name_type = params.get("name_type", "full")  # full, first, last
 
         if name_type == "first":
-            return np.array([self.faker.first_name() for _ in range(n_rows)])
+            return self._faker_column("first_name", n_rows, {}, lambda f: f.first_name())
         elif name_type == "last":
-            return np.array([self.faker.last_name() for _ in range(n_rows)])
+            return self._faker_column("last_name", n_rows, {}, lambda f: f.last_name())
         else:  # full
-            return np.array([self.faker.name() for _ in range(n_rows)])
+            return self._faker_column("name", n_rows, {}, lambda f: f.name())
 
     def _generate_dependent_column(
-        self, n_rows: int, col_type: str, dependency_data: np.ndarray,
+        self, n_rows: int, col_type: str, dependency_data: Union[np.ndarray, Tuple[np.ndarray, ...]],
         function_type: str, params: Dict
     ) -> np.ndarray:
         """
-        Generate a column that depends on another column.
+        Generate a column that depends on one or more other columns.
 
         Args:
             n_rows: Number of rows
             col_type: Target column type
-            dependency_data: Data from the column this depends on
+            dependency_data: Data from the column this depends on, or a tuple
+                of columns for a multi-column dependency
             function_type: Type of function to apply ('transform', 'map', 'custom')
             params: Additional parameters
 
         Returns:
             Generated dependent column data
         """
+        columns = dependency_data if isinstance(dependency_data, tuple) else (dependency_data,)
+
         if function_type == "transform":
+            if len(columns) != 1:
+                raise ValueError("transform depends on exactly one column")
+            dependency_data = columns[0]
             # Apply a transformation function
             transform_type = params.get("transform_type", "add")
             value = params.get("value", 1)
@@ -431,42 +1165,66 @@ class RandomDatasetGenerator:
             return result
 
         elif function_type == "map":
-            mapping = params.get("mapping", {})
-            default = params.get("default", None)
-
-            # Convert mapping keys to appropriate type if needed
-            if dependency_data.dtype == np.dtype('bool'):
-                mapping = {bool(k): v for k, v in mapping.items()}
-            elif np.issubdtype(dependency_data.dtype, np.integer):
-                mapping = {int(k): v for k, v in mapping.items()}
-            elif np.issubdtype(dependency_data.dtype, np.floating):
-                mapping = {float(k): v for k, v in mapping.items()}
-
-            # Apply mapping
-            result = np.array([mapping.get(x, default)
-                              for x in dependency_data])
-            return result
+            return self._map_columns(columns, params.get("mapping", {}), params.get("default", None))
 
         elif function_type == "custom":
             custom_func = params.get("function")
             if not custom_func:
                 raise ValueError("Custom function not provided")
 
-            # Convert string function to lambda
             if isinstance(custom_func, str):
-                if custom_func.startswith("x:"):
-                    try:
-                        func = eval(f"lambda {custom_func}")
-                        return np.array([func(x) for x in dependency_data])
-                    except Exception as e:
-                        raise ValueError(
-                            f"Error evaluating custom function: {e}")
+                func = _compile_expression(custom_func, len(columns))
+                result = func(*columns)
+                # Constant expressions still yield one value per row
+                return np.broadcast_to(result, (n_rows,)).copy() if np.ndim(result) == 0 else result
 
-            return dependency_data
+            return columns[0] if len(columns) == 1 else columns
 
         else:
             raise ValueError(f"Unknown function type: {function_type}")
 
+    @staticmethod
+    def _map_columns(columns: Tuple[np.ndarray, ...], mapping: Dict, default=None) -> np.ndarray:
+        """
+        Map column values through ``mapping`` by factorizing them and looking
+        up each distinct value (or combination, for several columns) once.
+        Multi-column mappings are keyed by tuples or nested dicts.
+        """
+        def key_of(dtype):
+            # Mapping keys arrive as strings from JSON configs
+            if dtype == np.dtype('bool'):
+                return bool
+            if np.issubdtype(dtype, np.integer):
+                return int
+            if np.issubdtype(dtype, np.floating):
+                return float
+            return lambda k: k
+
+        converters = [key_of(np.asarray(column).dtype) for column in columns]
+
+        if len(columns) == 1:
+            mapping = {converters[0](k): v for k, v in mapping.items()}
+            codes, uniques = pd.factorize(columns[0])
+            keys = list(uniques)
+        else:
+            def flatten(level, depth):
+                if depth == len(columns) - 1:
+                    return {(converters[depth](k),): v for k, v in level.items()}
+                return {(converters[depth](k),) + rest: v
+                        for k, sub in level.items() for rest, v in flatten(sub, depth + 1).items()}
+
+            if all(isinstance(k, tuple) for k in mapping):
+                mapping = {tuple(c(part) for c, part in zip(converters, k)): v
+                           for k, v in mapping.items()}
+            else:
+                mapping = flatten(mapping, 0)
+            codes, uniques = pd.MultiIndex.from_arrays(list(columns)).factorize()
+            keys = list(uniques)
+
+        lookup = np.array([mapping.get(k, default) for k in keys] + [default])
+        # Missing values factorize to -1, which picks the trailing default
+        return lookup[codes]
+
     def _generate_custom(
         self, n_rows: int, distribution: Optional[str], params: Dict, choices: Optional[List] = None
     ) -> np.ndarray:
@@ -477,28 +1235,35 @@ class RandomDatasetGenerator:
         1. A Faker provider method name (e.g., "license_plate")
         2. A lambda or function in string form (e.g., "lambda i: f'CUSTOM-{i}'")
         3. A dict with 'choices' to select from
+        4. Otherwise sequential IDs ``{prefix}{delimiter}{start + row}``, or
+           with ``compact`` the integers ``start + row`` as surrogate keys
         """
         if choices:
             weights = params.get("weights")
-            return np.random.choice(choices, size=n_rows, p=weights)
+            return self._sample_choices(choices, n_rows, weights)
 
         faker_method = params.get("faker_method")
         if faker_method:
             # Use a specific Faker provider method
             try:
-                provider_method = getattr(self.faker, faker_method)
-                return np.array([provider_method() for _ in range(n_rows)])
+                getattr(self.faker, faker_method)
             except AttributeError:
                 raise ValueError(f"Unknown Faker method: {faker_method}")
+            return self._faker_column(
+                f"custom:{faker_method}", n_rows, {},
+                lambda f: getattr(f, faker_method)())
 
         param_choices = params.get("choices")
         if param_choices:
             # Select from provided choices in params
             weights = params.get("weights")
-            return np.random.choice(param_choices, size=n_rows, p=weights)
+            return self._sample_choices(param_choices, n_rows, weights)
 
-        # Default to generated IDs
+        # Default to generated IDs; "compact" gives the BIGINT surrogate key
+        # of the same rows instead of the display string
+        start = params.get("start", 1) + self._row_offset
+        if params.get("compact"):
+            return np.arange(start, start + n_rows, dtype=np.int64)
         prefix = params.get("prefix", "ID")
         delimiter = params.get("delimiter", "_")
-        start = params.get("start", 1)
-        return np.array([f"{prefix}{delimiter}{start + i}" for i in range(n_rows)])
+        return sequential_ids(f"{prefix}{delimiter}", start, n_rows)
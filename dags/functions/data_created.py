@@ -1,21 +1,117 @@
-from DataRandomizer import RandomDatasetGenerator
+from DataRandomizer import ChoiceSampler, RandomDatasetGenerator
+from bronze import (BRONZE_FILE_FORMAT, UPLOAD_CHUNK_ROWS, UPLOAD_PART_SIZE, BronzeObjectWriter,
+                    bronze_table_for_key, upload_bronze_object)
+import argparse
+import io
+import os
+import string
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
 from faker import Faker
-from io import StringIO
 from botocore.exceptions import ClientError, NoCredentialsError
 import pandas as pd
 import numpy as np
-import random
 import boto3
 
 from datetime import datetime, timedelta
 
-
-def initialize_generators():
+# Rows per table at scale factor 1. Every table scales linearly, so orders
+# per customer, items per order and payments per order stay the same at any
+# scale factor.
+BASE_ROWS = {
+    "Geolocation": 5000,
+    "Customers": 20000,
+    "Products": 20000,
+    "Sellers": 5000,
+    "Orders": 5000,
+}
+# From this scale factor on Faker columns are sampled from pools
+POOLED_SCALE_FACTOR = 10
+# Zipf exponent of product popularity in order items (0 = every product
+# equally likely); ~1.1 gives a realistic bestseller long tail
+PRODUCT_POPULARITY_ZIPF = float(os.getenv("PRODUCT_POPULARITY_ZIPF", 0))
+# Emit a BIGINT surrogate key (customer_key, order_key, ...) next to every
+# text id, so bronze tables and the silver/gold joins can use integer keys
+COMPACT_KEYS = os.getenv("COMPACT_KEYS", "false").lower() == "true"
+# Incremental order keys are window * stride + n; a stride of 10^9 keeps
+# hourly windows (YYYYMMDDHH) within BIGINT and far above the full
+# history's 10-digit keys
+INCREMENTAL_KEY_STRIDE = 10**9
+
+
+def with_keys(columns):
+    """``columns`` plus the ``*_key`` column of each ``*_id`` when COMPACT_KEYS is on."""
+    if not COMPACT_KEYS:
+        return list(columns)
+    return list(columns) + [column[:-3] + "_key" for column in columns if column.endswith("_id")]
+
+
+# Table -> {table it samples from: columns it needs}
+TABLE_DEPENDENCIES = {
+    "Geolocation": {},
+    "Customers": {},
+    "Products": {},
+    "Sellers": {},
+    "Orders": {"Customers": with_keys(["customer_id"])},
+    "Order Items": {"Orders": with_keys(["order_id", "order_purchase_timestamp"]),
+                    "Products": with_keys(["product_id", "product_price"]),
+                    "Sellers": with_keys(["seller_id"])},
+    "Payments": {"Orders": with_keys(["order_id"]), "Order Items": ["order_id", "price"]},
+}
+
+CITY_REGION_MAPPING = {
+    "Manila": {"region": "NCR", "lat_range": (14.55, 14.62), "lng_range": (120.97, 121.02)},
+    "Quezon City": {"region": "NCR", "lat_range": (14.63, 14.74), "lng_range": (121.02, 121.11)},
+    "Antipolo": {"region": "NCR", "lat_range": (14.55, 14.62), "lng_range": (121.15, 121.25)},
+    "Caloocan": {"region": "NCR", "lat_range": (14.65, 14.73), "lng_range": (120.95, 121.01)},
+    "Pasig": {"region": "NCR", "lat_range": (14.56, 14.60), "lng_range": (121.06, 121.10)},
+    "Taguig": {"region": "NCR", "lat_range": (14.50, 14.55), "lng_range": (121.03, 121.08)},
+    "Makati": {"region": "NCR", "lat_range": (14.54, 14.57), "lng_range": (121.01, 121.06)},
+    "Parañaque": {"region": "NCR", "lat_range": (14.47, 14.52), "lng_range": (120.98, 121.03)},
+    "Las Piñas": {"region": "NCR", "lat_range": (14.43, 14.48), "lng_range": (120.96, 121.03)},
+    "Muntinlupa": {"region": "NCR", "lat_range": (14.37, 14.43), "lng_range": (121.02, 121.08)},
+    "Valenzuela": {"region": "NCR", "lat_range": (14.70, 14.75), "lng_range": (120.95, 121.00)},
+    "Marikina": {"region": "NCR", "lat_range": (14.63, 14.68), "lng_range": (121.09, 121.13)},
+    "Mandaluyong": {"region": "NCR", "lat_range": (14.57, 14.60), "lng_range": (121.02, 121.05)},
+    "Pasay": {"region": "NCR", "lat_range": (14.53, 14.57), "lng_range": (120.99, 121.03)},
+    "Cebu City": {"region": "Region VII", "lat_range": (10.26, 10.36), "lng_range": (123.85, 123.95)},
+    "Lapu-Lapu": {"region": "Region VII", "lat_range": (10.27, 10.33), "lng_range": (123.95, 124.02)},
+    "Mandaue": {"region": "Region VII", "lat_range": (10.33, 10.36), "lng_range": (123.91, 123.95)},
+    "Talisay": {"region": "Region VII", "lat_range": (10.23, 10.27), "lng_range": (123.82, 123.88)},
+    "Bacolod": {"region": "Region VI", "lat_range": (10.62, 10.72), "lng_range": (122.90, 123.00)},
+    "Iloilo City": {"region": "Region VI", "lat_range": (10.65, 10.72), "lng_range": (122.53, 122.59)},
+    "Davao City": {"region": "Region XI", "lat_range": (7.02, 7.25), "lng_range": (125.45, 125.65)},
+    "General Santos City": {"region": "Region XI", "lat_range": (6.06, 6.15), "lng_range": (125.10, 125.20)},
+    "Zamboanga City": {"region": "Region IX", "lat_range": (6.90, 6.98), "lng_range": (122.00, 122.15)},
+    "Cagayan de Oro": {"region": "Region X", "lat_range": (8.45, 8.53), "lng_range": (124.62, 124.70)},
+    "Dasmariñas": {"region": "Region IV-A", "lat_range": (14.28, 14.35), "lng_range": (120.91, 120.98)},
+    "Bacoor": {"region": "Region IV-A", "lat_range": (14.43, 14.49), "lng_range": (120.95, 121.00)}
+}
+
+CITIES = list(CITY_REGION_MAPPING.keys())
+CITY_TO_REGION = {city: info["region"] for city, info in CITY_REGION_MAPPING.items()}
+
+PRODUCT_CATEGORIES = [
+    "Groceries", "Health & Personal Care", "Beauty & Cosmetics", "Household Essentials",
+    "Home Improvement & Tools", "Furniture", "Electronics & Accessories", "Appliances",
+    "Clothing & Apparel", "Shoes & Footwear"
+]
+
+
+def scaled_rows(scale_factor=1):
+    """Row counts per table for a TPC-style scale factor (SF=1 is the base dataset)."""
+    if scale_factor <= 0:
+        raise ValueError("scale_factor must be positive")
+    return {name: max(1, round(rows * scale_factor)) for name, rows in BASE_ROWS.items()}
+
+
+def initialize_generators(n_workers=1, seed=42, pooled=False):
     """Initialize the data generators with proper error handling."""
     try:
-        generator = RandomDatasetGenerator(seed=42, locale='en_US')
+        generator = RandomDatasetGenerator(
+            seed=seed, locale='en_US', pooled=pooled, n_workers=n_workers)
         faker = Faker()
-        faker.seed_instance(42)
+        faker.seed_instance(seed)
         return generator, faker
     except Exception as e:
         print(f"Failed to initialize generators: {e}")
@@ -25,12 +121,14 @@ def initialize_generators():
 def create_s3_client():
     """Create S3 client with proper error handling."""
     try:
+        # Defaults match docker-compose; override to point at any S3 stand-in
         s3_client = boto3.client(
             's3',
-            endpoint_url='http://minio:9000',
-            aws_access_key_id='minioLocalAccessKey',
-            aws_secret_access_key='minioLocalSecretKey123',
-            region_name='us-east-1'
+            endpoint_url=os.getenv('MINIO_ENDPOINT_URL', 'http://minio:9000'),
+            aws_access_key_id=os.getenv('MINIO_ACCESS_KEY', 'minioLocalAccessKey'),
+            aws_secret_access_key=os.getenv(
+                'MINIO_SECRET_KEY', 'minioLocalSecretKey123'),
+            region_name=os.getenv('MINIO_REGION', 'us-east-1')
         )
         return s3_client
     except NoCredentialsError:
@@ -60,63 +158,89 @@ def ensure_bucket_exists(s3_client, bucket_name):
             raise
 
 
-def generate_geolocation_data(generator):
+def generate_table(generator, n_rows, columns_config, finish, chunk_rows=None):
+    """
+    Generate a table and pass it through ``finish``. With ``chunk_rows`` a
+    lazy iterator of finished chunks is returned instead of a DataFrame, so
+    the table can be streamed without ever being held in memory.
+    """
+    if chunk_rows is None:
+        return finish(generator.generate_dataset(n_rows=n_rows, columns_config=columns_config))
+    return (finish(chunk) for chunk in generator.generate_dataset_iter(
+        n_rows, columns_config, chunk_size=chunk_rows))
+
+
+def add_compact_key(columns_config, key_name, start=None):
+    """
+    Append the BIGINT surrogate of the table's sequential id (its first
+    column) when COMPACT_KEYS is on. It is appended rather than inserted so
+    every other column keeps its random stream and its values.
+    """
+    if not COMPACT_KEYS:
+        return columns_config
+    params = dict(columns_config[0]["params"], compact=True)
+    if start is not None:
+        params["start"] = start
+    return columns_config + [{"name": key_name, "type": "custom", "params": params}]
+
+
+def sample_keys(keys, size, rng, zipf=None, positions=None):
+    """
+    Draw ``size`` keys with replacement, uniformly or with Zipf popularity.
+    Sampling positions and taking them from a Series avoids copying
+    millions of keys per draw. Pass the ``positions`` of an earlier draw to
+    take the matching rows of another key column.
+    """
+    keys = keys if isinstance(keys, pd.Series) else pd.Series(keys)
+    if positions is None:
+        positions = ChoiceSampler(size=len(keys), zipf=zipf).positions(rng, size)
+    return keys.iloc[positions].to_numpy(), positions
+
+
+def take_keys(target_df, source_df, positions, key_columns):
+    """Copy the ``key_columns`` ``source_df`` has, at ``positions``, into ``target_df``."""
+    for column in key_columns:
+        if column in source_df:
+            target_df[column] = source_df[column].to_numpy()[positions]
+    return target_df
+
+
+def generate_geolocation_data(generator, n_rows=BASE_ROWS["Geolocation"], chunk_rows=None):
     """Generate geolocation data with improved error handling."""
     print("1. Generating Geolocation data...")
 
-    city_region_mapping = {
-        "Manila": {"region": "NCR", "lat_range": (14.55, 14.62), "lng_range": (120.97, 121.02)},
-        "Quezon City": {"region": "NCR", "lat_range": (14.63, 14.74), "lng_range": (121.02, 121.11)},
-        "Antipolo": {"region": "NCR", "lat_range": (14.55, 14.62), "lng_range": (121.15, 121.25)},
-        "Caloocan": {"region": "NCR", "lat_range": (14.65, 14.73), "lng_range": (120.95, 121.01)},
-        "Pasig": {"region": "NCR", "lat_range": (14.56, 14.60), "lng_range": (121.06, 121.10)},
-        "Taguig": {"region": "NCR", "lat_range": (14.50, 14.55), "lng_range": (121.03, 121.08)},
-        "Makati": {"region": "NCR", "lat_range": (14.54, 14.57), "lng_range": (121.01, 121.06)},
-        "Parañaque": {"region": "NCR", "lat_range": (14.47, 14.52), "lng_range": (120.98, 121.03)},
-        "Las Piñas": {"region": "NCR", "lat_range": (14.43, 14.48), "lng_range": (120.96, 121.03)},
-        "Muntinlupa": {"region": "NCR", "lat_range": (14.37, 14.43), "lng_range": (121.02, 121.08)},
-        "Valenzuela": {"region": "NCR", "lat_range": (14.70, 14.75), "lng_range": (120.95, 121.00)},
-        "Marikina": {"region": "NCR", "lat_range": (14.63, 14.68), "lng_range": (121.09, 121.13)},
-        "Mandaluyong": {"region": "NCR", "lat_range": (14.57, 14.60), "lng_range": (121.02, 121.05)},
-        "Pasay": {"region": "NCR", "lat_range": (14.53, 14.57), "lng_range": (120.99, 121.03)},
-        "Cebu City": {"region": "Region VII", "lat_range": (10.26, 10.36), "lng_range": (123.85, 123.95)},
-        "Lapu-Lapu": {"region": "Region VII", "lat_range": (10.27, 10.33), "lng_range": (123.95, 124.02)},
-        "Mandaue": {"region": "Region VII", "lat_range": (10.33, 10.36), "lng_range": (123.91, 123.95)},
-        "Talisay": {"region": "Region VII", "lat_range": (10.23, 10.27), "lng_range": (123.82, 123.88)},
-        "Bacolod": {"region": "Region VI", "lat_range": (10.62, 10.72), "lng_range": (122.90, 123.00)},
-        "Iloilo City": {"region": "Region VI", "lat_range": (10.65, 10.72), "lng_range": (122.53, 122.59)},
-        "Davao City": {"region": "Region XI", "lat_range": (7.02, 7.25), "lng_range": (125.45, 125.65)},
-        "General Santos City": {"region": "Region XI", "lat_range": (6.06, 6.15), "lng_range": (125.10, 125.20)},
-        "Zamboanga City": {"region": "Region IX", "lat_range": (6.90, 6.98), "lng_range": (122.00, 122.15)},
-        "Cagayan de Oro": {"region": "Region X", "lat_range": (8.45, 8.53), "lng_range": (124.62, 124.70)},
-        "Dasmariñas": {"region": "Region IV-A", "lat_range": (14.28, 14.35), "lng_range": (120.91, 120.98)},
-        "Bacoor": {"region": "Region IV-A", "lat_range": (14.43, 14.49), "lng_range": (120.95, 121.00)}
-    }
-
+    city_region_mapping = CITY_REGION_MAPPING
     cities = list(city_region_mapping.keys())
 
-    try:
-        geoloc_df = generator.generate_dataset(
-            n_rows=5000,
-            columns_config=[{"name": "geolocation_city",
-                             "type": "category", "choices": cities}]
-        )
+    bounds = pd.DataFrame(
+        [(*info["lat_range"], *info["lng_range"]) for info in city_region_mapping.values()],
+        index=cities, columns=["lat_min", "lat_max", "lng_min", "lng_max"])
 
-        geoloc_df["geolocation_region"] = geoloc_df["geolocation_city"].map(
-            lambda c: city_region_mapping[c]["region"]
-        )
-
-        np.random.seed(42)
-        geoloc_df["geolocation_lat"] = geoloc_df["geolocation_city"].apply(
-            lambda c: np.round(np.random.uniform(
-                *city_region_mapping[c]["lat_range"]), 6)
-        )
-        geoloc_df["geolocation_lng"] = geoloc_df["geolocation_city"].apply(
-            lambda c: np.round(np.random.uniform(
-                *city_region_mapping[c]["lng_range"]), 6)
-        )
-
-        print(f"   ✓ Generated {len(geoloc_df)} geolocation records")
+    try:
+        rng = generator.spawn_rng()
+
+        def finish(geoloc_df):
+            # The id is configured last so the other columns keep their
+            # random streams; it leads the table as its primary key
+            geoloc_df.insert(0, "geolocation_id", geoloc_df.pop("geolocation_id"))
+            city_bounds = bounds.loc[geoloc_df["geolocation_city"]]
+            geoloc_df["geolocation_lat"] = np.round(rng.uniform(
+                city_bounds["lat_min"].to_numpy(), city_bounds["lat_max"].to_numpy()), 6)
+            geoloc_df["geolocation_lng"] = np.round(rng.uniform(
+                city_bounds["lng_min"].to_numpy(), city_bounds["lng_max"].to_numpy()), 6)
+            return geoloc_df
+
+        geoloc_df = generate_table(
+            generator, n_rows,
+            [{"name": "geolocation_city", "type": "category", "choices": cities},
+             {"name": "geolocation_region", "type": "category",
+              "depends_on": {"column": "geolocation_city", "function": "map"},
+              "params": {"mapping": CITY_TO_REGION}},
+             {"name": "geolocation_id", "type": "custom", "params": {
+                 "prefix": "GEO", "delimiter": "_", "start": 1}}],
+            finish, chunk_rows)
+        if chunk_rows is None:
+            print(f"   ✓ Generated {len(geoloc_df)} geolocation records")
         return geoloc_df, city_region_mapping
 
     except Exception as e:
@@ -124,7 +248,7 @@ def generate_geolocation_data(generator):
         raise
 
 
-def generate_customers_data(generator, cities, regions):
+def generate_customers_data(generator, cities, n_rows=BASE_ROWS["Customers"], chunk_rows=None):
     """Generate customer data with proper validation."""
     print("2. Generating Customers data...")
 
@@ -142,17 +266,16 @@ def generate_customers_data(generator, cities, regions):
                 "params": {"min": 18, "max": 65}},
             {"name": "customer_gender", "type": "gender"},
             {"name": "customer_city", "type": "category", "choices": cities},
-            {"name": "customer_region", "type": "category", "choices": regions}
+            {"name": "customer_region", "type": "category",
+                "depends_on": {"column": "customer_city", "function": "map"},
+                "params": {"mapping": CITY_TO_REGION}}
         ]
 
-        customers_df = generator.generate_dataset(
-            n_rows=20000, columns_config=customers_config)
-
-        city_to_region = dict(zip(cities, regions))
-        customers_df["customer_region"] = customers_df["customer_city"].map(
-            city_to_region)
-
-        print(f"   ✓ Generated {len(customers_df)} customer records")
+        customers_df = generate_table(
+            generator, n_rows, add_compact_key(customers_config, "customer_key"),
+            lambda df: df, chunk_rows)
+        if chunk_rows is None:
+            print(f"   ✓ Generated {len(customers_df)} customer records")
         return customers_df
 
     except Exception as e:
@@ -160,7 +283,8 @@ def generate_customers_data(generator, cities, regions):
         raise
 
 
-def generate_sellers_data(generator, cities, regions, product_categories):
+def generate_sellers_data(generator, cities, product_categories,
+                          n_rows=BASE_ROWS["Sellers"], chunk_rows=None):
     """Generate seller data with validation."""
     print("3. Generating Sellers data...")
 
@@ -182,18 +306,19 @@ def generate_sellers_data(generator, cities, regions, product_categories):
             {"name": "seller_fulfillment_type",
                 "type": "category", "choices": fulfillment_types},
             {"name": "seller_city", "type": "category", "choices": cities},
-            {"name": "seller_state", "type": "category", "choices": regions}
+            {"name": "seller_state", "type": "category",
+                "depends_on": {"column": "seller_city", "function": "map"},
+                "params": {"mapping": CITY_TO_REGION}}
         ]
 
-        sellers_df = generator.generate_dataset(
-            n_rows=5000, columns_config=sellers_config)
-        sellers_df = sellers_df.round(2)
-
-        city_to_region = dict(zip(cities, regions))
-        sellers_df["seller_state"] = sellers_df["seller_city"].map(
-            city_to_region)
+        def finish(sellers_df):
+            sellers_df["seller_rating"] = sellers_df["seller_rating"].round(2)
+            return sellers_df
 
-        print(f"   ✓ Generated {len(sellers_df)} seller records")
+        sellers_df = generate_table(
+            generator, n_rows, add_compact_key(sellers_config, "seller_key"), finish, chunk_rows)
+        if chunk_rows is None:
+            print(f"   ✓ Generated {len(sellers_df)} seller records")
         return sellers_df
 
     except Exception as e:
@@ -201,109 +326,146 @@ def generate_sellers_data(generator, cities, regions, product_categories):
         raise
 
 
-def category_based_product_name(row, faker):
-    """Generate product names based on category with better error handling."""
-    product_name_templates = {
-        "Groceries": [
-            "Organic {fruit}", "Pack of {number} Canned {vegetable}", "{brand} Whole Wheat Bread",
-            "{brand} Brown Rice 1kg", "Fresh {vegetable}", "{brand} Almond Milk"
-        ],
-        "Health & Personal Care": [
-            "{brand} Toothpaste", "{brand} Vitamin C 1000mg", "Men's Razor Kit", "Herbal Shampoo 500ml",
-            "Antibacterial Hand Gel", "Body Lotion with Aloe Vera"
-        ],
-        "Beauty & Cosmetics": [
-            "{brand} Lipstick", "Waterproof Mascara", "BB Cream SPF 30", "Facial Cleanser 150ml",
-            "Compact Powder", "Makeup Remover Wipes"
-        ],
-        "Household Essentials": [
-            "Multi-purpose Cleaner", "Dishwashing Liquid", "Laundry Detergent 3L",
-            "Paper Towels (6 Rolls)", "Garbage Bags 30L", "{brand} Toilet Paper"
-        ],
-        "Home Improvement & Tools": [
-            "Cordless Drill", "Hammer Set", "LED Light Bulb Pack", "Paint Roller Kit",
-            "Screwdriver Set", "Measuring Tape 5m"
-        ],
-        "Furniture": [
-            "Ergonomic Office Chair", "Wooden Coffee Table", "Modern Sofa Set",
-            "Bookshelf - 5 Tier", "Dining Set for 4", "Queen Size Mattress"
-        ],
-        "Electronics & Accessories": [
-            "{brand} Bluetooth Headphones", "Wireless Mouse", "4K LED Monitor", "USB-C Hub Adapter",
-            "Phone Charging Cable", "{brand} Power Bank 10000mAh"
-        ],
-        "Appliances": [
-            "Air Fryer 3L", "Microwave Oven 25L", "{brand} Washing Machine", "Portable Air Conditioner",
-            "Electric Kettle", "Mini Refrigerator"
-        ],
-        "Clothing & Apparel": [
-            "Men's Slim Fit Jeans", "Women's Summer Dress", "Unisex Hoodie", "Cotton T-Shirt Pack",
-            "Winter Jacket", "Activewear Leggings"
-        ],
-        "Shoes & Footwear": [
-            "Running Shoes - Men", "Leather Loafers", "Heeled Sandals", "Canvas Sneakers",
-            "Kids' Rain Boots", "Flip Flops Pack"
-        ]
-    }
+# Product name templates per category; every category has the same number
+# of templates so one integer column picks a template for any category
+PRODUCT_NAME_TEMPLATES = {
+    "Groceries": [
+        "Organic {fruit}", "Pack of {number} Canned {vegetable}", "{brand} Whole Wheat Bread",
+        "{brand} Brown Rice 1kg", "Fresh {vegetable}", "{brand} Almond Milk"
+    ],
+    "Health & Personal Care": [
+        "{brand} Toothpaste", "{brand} Vitamin C 1000mg", "Men's Razor Kit", "Herbal Shampoo 500ml",
+        "Antibacterial Hand Gel", "Body Lotion with Aloe Vera"
+    ],
+    "Beauty & Cosmetics": [
+        "{brand} Lipstick", "Waterproof Mascara", "BB Cream SPF 30", "Facial Cleanser 150ml",
+        "Compact Powder", "Makeup Remover Wipes"
+    ],
+    "Household Essentials": [
+        "Multi-purpose Cleaner", "Dishwashing Liquid", "Laundry Detergent 3L",
+        "Paper Towels (6 Rolls)", "Garbage Bags 30L", "{brand} Toilet Paper"
+    ],
+    "Home Improvement & Tools": [
+        "Cordless Drill", "Hammer Set", "LED Light Bulb Pack", "Paint Roller Kit",
+        "Screwdriver Set", "Measuring Tape 5m"
+    ],
+    "Furniture": [
+        "Ergonomic Office Chair", "Wooden Coffee Table", "Modern Sofa Set",
+        "Bookshelf - 5 Tier", "Dining Set for 4", "Queen Size Mattress"
+    ],
+    "Electronics & Accessories": [
+        "{brand} Bluetooth Headphones", "Wireless Mouse", "4K LED Monitor", "USB-C Hub Adapter",
+        "Phone Charging Cable", "{brand} Power Bank 10000mAh"
+    ],
+    "Appliances": [
+        "Air Fryer 3L", "Microwave Oven 25L", "{brand} Washing Machine", "Portable Air Conditioner",
+        "Electric Kettle", "Mini Refrigerator"
+    ],
+    "Clothing & Apparel": [
+        "Men's Slim Fit Jeans", "Women's Summer Dress", "Unisex Hoodie", "Cotton T-Shirt Pack",
+        "Winter Jacket", "Activewear Leggings"
+    ],
+    "Shoes & Footwear": [
+        "Running Shoes - Men", "Leather Loafers", "Heeled Sandals", "Canvas Sneakers",
+        "Kids' Rain Boots", "Flip Flops Pack"
+    ]
+}
+GENERIC_PRODUCT_NAME_TEMPLATES = ["Generic {brand} Product"]
+PRODUCT_NAME_TEMPLATE_COUNT = len(PRODUCT_NAME_TEMPLATES["Groceries"])
+
+
+def product_name_columns():
+    """
+    Helper columns the product names are built from. They are appended to
+    the products config, so the other columns keep their random streams,
+    and dropped once the names are built.
+    """
+    return [
+        {"name": "_name_template", "type": "integer",
+            "params": {"min": 0, "max": PRODUCT_NAME_TEMPLATE_COUNT - 1}},
+        {"name": "_brand", "type": "company"},
+        {"name": "_fruit", "type": "category",
+            "choices": ["Apples", "Bananas", "Oranges", "Mangoes"]},
+        {"name": "_vegetable", "type": "category",
+            "choices": ["Carrots", "Spinach", "Peas", "Broccoli"]},
+        {"name": "_number", "type": "integer", "params": {"min": 2, "max": 6}},
+    ]
 
-    try:
-        category = row["product_category_name"]
-        templates = product_name_templates.get(
-            category, ["Generic {brand} Product"])
-        template = random.choice(templates)
-
-        return template.format(
-            brand=faker.company(),
-            fruit=random.choice(["Apples", "Bananas", "Oranges", "Mangoes"]),
-            vegetable=random.choice(
-                ["Carrots", "Spinach", "Peas", "Broccoli"]),
-            number=random.randint(2, 6)
-        )
-    except Exception as e:
-        print(
-            f"Error generating product name for category {row.get('product_category_name', 'Unknown')}: {e}")
-        return f"Generic Product - {faker.word().capitalize()}"
+
+def category_based_product_name(products_df):
+    """
+    Build product names from the category and the helper columns, one
+    vectorized string concatenation per template instead of a Faker call
+    per row.
+    """
+    fields = {
+        "brand": products_df.pop("_brand").to_numpy(dtype=object),
+        "fruit": products_df.pop("_fruit").to_numpy(dtype=object),
+        "vegetable": products_df.pop("_vegetable").to_numpy(dtype=object),
+        "number": products_df.pop("_number").to_numpy().astype(str).astype(object),
+    }
+    template_idx = products_df.pop("_name_template").to_numpy()
+    categories = products_df["product_category_name"].to_numpy(dtype=object)
+
+    names = np.empty(len(products_df), dtype=object)
+    for category in pd.unique(categories):
+        templates = PRODUCT_NAME_TEMPLATES.get(category, GENERIC_PRODUCT_NAME_TEMPLATES)
+        in_category = categories == category
+        for idx, template in enumerate(templates):
+            rows = np.flatnonzero(in_category & (template_idx % len(templates) == idx))
+            if not len(rows):
+                continue
+            name = np.full(len(rows), "", dtype=object)
+            for literal, field, _, _ in string.Formatter().parse(template):
+                name = name + literal
+                if field is not None:
+                    name = name + fields[field][rows]
+            names[rows] = name
+    return names
+
+
+def products_columns(product_categories=PRODUCT_CATEGORIES):
+    """Column configuration of the generated part of the products table."""
+    return [
+        {"name": "product_id", "type": "custom", "params": {
+            "prefix": "PROD", "delimiter": "_", "start": 100000001}},
+        {"name": "product_category_name", "type": "category",
+            "choices": product_categories},
+        {"name": "product_description", "type": "paragraph",
+            "params": {"nb_sentences": 3}},
+        {"name": "product_price", "type": "float", "params": {
+            "min": 20, "max": 100000, "round": 2}},
+        {"name": "product_photos_qty", "type": "integer",
+            "params": {"min": 1, "max": 10}},
+        {"name": "product_weight_g", "type": "float",
+            "params": {"min": 50, "max": 5000}},
+        {"name": "product_length_cm", "type": "float",
+            "params": {"min": 5, "max": 100}},
+        {"name": "product_height_cm", "type": "float",
+            "params": {"min": 1, "max": 50}},
+        {"name": "product_width_cm", "type": "float",
+            "params": {"min": 3, "max": 80}}
+    ]
 
 
-def generate_products_data(generator, faker):
+def generate_products_data(generator, faker, n_rows=BASE_ROWS["Products"], chunk_rows=None):
     """Generate product data with improved error handling."""
     print("4. Generating Products data...")
 
-    product_categories = [
-        "Groceries", "Health & Personal Care", "Beauty & Cosmetics", "Household Essentials",
-        "Home Improvement & Tools", "Furniture", "Electronics & Accessories", "Appliances",
-        "Clothing & Apparel", "Shoes & Footwear"
-    ]
+    product_categories = PRODUCT_CATEGORIES
 
     try:
-        products_config = [
-            {"name": "product_id", "type": "custom", "params": {
-                "prefix": "PROD", "delimiter": "_", "start": 100000001}},
-            {"name": "product_category_name", "type": "category",
-                "choices": product_categories},
-            {"name": "product_description", "type": "paragraph",
-                "params": {"nb_sentences": 3}},
-            {"name": "product_price", "type": "float", "params": {
-                "min": 20, "max": 100000, "round": 2}},
-            {"name": "product_photos_qty", "type": "integer",
-                "params": {"min": 1, "max": 10}},
-            {"name": "product_weight_g", "type": "float",
-                "params": {"min": 50, "max": 5000}},
-            {"name": "product_length_cm", "type": "float",
-                "params": {"min": 5, "max": 100}},
-            {"name": "product_height_cm", "type": "float",
-                "params": {"min": 1, "max": 50}},
-            {"name": "product_width_cm", "type": "float",
-                "params": {"min": 3, "max": 80}}
-        ]
+        products_config = add_compact_key(
+            products_columns(product_categories) + product_name_columns(), "product_key")
 
-        products_df = generator.generate_dataset(
-            n_rows=20000, columns_config=products_config)
-        products_df["product_name"] = products_df.apply(
-            lambda row: category_based_product_name(row, faker), axis=1
-        )
+        def finish(products_df):
+            products_df["product_name"] = category_based_product_name(products_df)
+            return products_df
 
-        print(f"   ✓ Generated {len(products_df)} product records")
+        products_df = generate_table(
+            generator, n_rows, products_config, finish, chunk_rows)
+        if chunk_rows is None:
+            print(f"   ✓ Generated {len(products_df)} product records")
         return products_df, product_categories
 
     except Exception as e:
@@ -311,51 +473,77 @@ def generate_products_data(generator, faker):
         raise
 
 
-def generate_orders_data(generator, customer_ids):
-    """Generate orders data with improved date handling."""
-    print("5. Generating Orders data...")
-
-    order_statuses = ["delivered", "shipped",
-                      "processing", "canceled", "pending"]
-
-    try:
-        orders_config = [
-            {"name": "order_id", "type": "custom", "params": {
-                "prefix": "ORD", "delimiter": "_", "start": 1000000001}},
-            {"name": "customer_id", "type": "category", "choices": customer_ids},
-            {"name": "order_status", "type": "category", "choices": order_statuses},
-            {"name": "order_purchase_timestamp", "type": "datetime", "params": {
-                "start": "2000-01-01T00:00:00",
-                "end": "2024-12-31T23:59:59"
-            }},
-            {"name": "order_estimated_delivery_date", "type": "datetime", "params": {
-                "start": "2000-01-01T00:00:00",
-                "end": "2025-01-31T23:59:59"
-            }}
-        ]
+ORDER_STATUSES = ["delivered", "shipped", "processing", "canceled", "pending"]
+
+
+def orders_columns(start="2000-01-01T00:00:00", end="2024-12-31T23:59:59",
+                   id_prefix="ORD", id_start=1000000001):
+    """Column configuration of the generated part of the orders table."""
+    delivery_end = (pd.Timestamp(end) + pd.Timedelta(days=31)).isoformat()
+    return [
+        {"name": "order_id", "type": "custom", "params": {
+            "prefix": id_prefix, "delimiter": "_", "start": id_start}},
+        {"name": "order_status", "type": "category", "choices": ORDER_STATUSES},
+        {"name": "order_purchase_timestamp", "type": "datetime", "params": {
+            "start": start,
+            "end": end
+        }},
+        {"name": "order_estimated_delivery_date", "type": "datetime", "params": {
+            "start": start,
+            "end": delivery_end
+        }}
+    ]
 
-        orders_df = generator.generate_dataset(
-            n_rows=5000, columns_config=orders_config)
 
-        orders_df['order_delivered_carrier_date'] = pd.NaT
-        orders_df['order_delivered_customer_date'] = pd.NaT
+def generate_orders_data(generator, customer_ids, n_orders=BASE_ROWS["Orders"],
+                         start="2000-01-01T00:00:00", end="2024-12-31T23:59:59",
+                         id_prefix="ORD", id_start=1000000001, chunk_rows=None,
+                         customer_keys=None, key_start=None):
+    """
+    Generate orders data with improved date handling. Purchases fall
+    between ``start`` and ``end``; estimated deliveries run up to a month
+    past ``end``. Customers are drawn uniformly from ``customer_ids`` (a list
+    or Series); ``customer_keys``, aligned with it, fills customer_key.
+    With COMPACT_KEYS order_key counts up from ``key_start`` (default
+    ``id_start``).
+    """
+    print("5. Generating Orders data...")
 
-        delivered_mask = orders_df['order_status'].isin(
-            ['delivered', 'shipped'])
-        if delivered_mask.any():
-            orders_df.loc[delivered_mask, 'order_delivered_carrier_date'] = (
-                pd.to_datetime(orders_df.loc[delivered_mask, 'order_purchase_timestamp']) +
-                pd.to_timedelta(np.random.randint(
-                    1, 6, size=delivered_mask.sum()), unit='D')
-            )
+    try:
+        orders_config = add_compact_key(
+            orders_columns(start, end, id_prefix, id_start), "order_key", key_start)
+
+        rng = generator.spawn_rng()
+
+        def finish(orders_df):
+            sampled_ids, positions = sample_keys(customer_ids, len(orders_df), rng)
+            orders_df.insert(1, 'customer_id', sampled_ids)
+            if customer_keys is not None:
+                orders_df['customer_key'] = sample_keys(
+                    customer_keys, len(orders_df), rng, positions=positions)[0]
+            orders_df['order_delivered_carrier_date'] = pd.NaT
+            orders_df['order_delivered_customer_date'] = pd.NaT
+
+            delivered_mask = orders_df['order_status'].isin(
+                ['delivered', 'shipped'])
+            if delivered_mask.any():
+                orders_df.loc[delivered_mask, 'order_delivered_carrier_date'] = (
+                    pd.to_datetime(orders_df.loc[delivered_mask, 'order_purchase_timestamp']) +
+                    pd.to_timedelta(rng.integers(
+                        1, 6, size=delivered_mask.sum()), unit='D')
+                )
 
-            orders_df.loc[delivered_mask, 'order_delivered_customer_date'] = (
-                pd.to_datetime(orders_df.loc[delivered_mask, 'order_delivered_carrier_date']) +
-                pd.to_timedelta(np.random.randint(
-                    0, 4, size=delivered_mask.sum()), unit='D')
-            )
+                orders_df.loc[delivered_mask, 'order_delivered_customer_date'] = (
+                    pd.to_datetime(orders_df.loc[delivered_mask, 'order_delivered_carrier_date']) +
+                    pd.to_timedelta(rng.integers(
+                        0, 4, size=delivered_mask.sum()), unit='D')
+                )
+            return orders_df
 
-        print(f"   ✓ Generated {len(orders_df)} order records")
+        orders_df = generate_table(
+            generator, n_orders, orders_config, finish, chunk_rows)
+        if chunk_rows is None:
+            print(f"   ✓ Generated {len(orders_df)} order records")
         return orders_df
 
     except Exception as e:
@@ -363,50 +551,51 @@ def generate_orders_data(generator, customer_ids):
         raise
 
 
-def generate_order_items_data(orders_df, products_df, sellers_df):
-    """Generate order items with improved price calculations."""
+def generate_order_items_data(orders_df, products_df, sellers_df, rng):
+    """Generate order items with vectorized sampling and price lookups."""
     print("6. Generating Order Items data...")
 
     try:
-        order_items_data = []
-        order_ids = orders_df['order_id'].tolist()
-        product_ids = products_df['product_id'].tolist()
-        seller_ids = sellers_df['seller_id'].tolist()
-
-        price_lookup = dict(
-            zip(products_df['product_id'], products_df['product_price']))
-
-        for order_id in order_ids:
-            n_items = np.random.randint(1, 5)
-
-            for item_id in range(1, n_items + 1):
-                product_id = np.random.choice(product_ids)
-                seller_id = np.random.choice(seller_ids)
-                price = price_lookup.get(product_id, 100.0)
-
-                discount_pct = np.random.uniform(0, 0.2)
-                final_price = price * (1 - discount_pct)
-
-                freight_value = final_price * np.random.uniform(0.05, 0.15)
-
-                order_date = orders_df[orders_df['order_id'] ==
-                                       order_id]['order_purchase_timestamp'].iloc[0]
-                shipping_limit = pd.to_datetime(
-                    order_date) + pd.Timedelta(days=np.random.randint(1, 8))
-
-                order_items_data.append({
-                    'order_id': order_id,
-                    'order_item_id': item_id,
-                    'product_id': product_id,
-                    'seller_id': seller_id,
-                    'shipping_limit_date': shipping_limit,
-                    'price': round(final_price, 2),
-                    'freight_value': round(freight_value, 2),
-                    'discount_pct': round(discount_pct, 2),
-                    'coupon_applied': random.choice([True, False])
-                })
-
-        order_items_df = pd.DataFrame(order_items_data)
+        n_orders = len(orders_df)
+
+        # 1-4 items per order, expanded into one row per item
+        items_per_order = rng.integers(1, 5, size=n_orders)
+        n_items = int(items_per_order.sum())
+        order_pos = np.repeat(np.arange(n_orders), items_per_order)
+        first_item_pos = np.cumsum(items_per_order) - items_per_order
+        order_item_ids = np.arange(
+            n_items) - np.repeat(first_item_pos, items_per_order) + 1
+
+        # Positional samples double as an indexed join onto the product and
+        # seller tables, so no per-item lookups are needed
+        product_pos = ChoiceSampler(
+            size=len(products_df), zipf=PRODUCT_POPULARITY_ZIPF or None).positions(rng, n_items)
+        seller_pos = rng.integers(0, len(sellers_df), size=n_items)
+        price = products_df['product_price'].to_numpy(dtype=float)[product_pos]
+
+        discount_pct = rng.uniform(0, 0.2, size=n_items)
+        final_price = price * (1 - discount_pct)
+        freight_value = final_price * rng.uniform(0.05, 0.15, size=n_items)
+
+        order_dates = pd.to_datetime(
+            orders_df['order_purchase_timestamp']).to_numpy()[order_pos]
+        shipping_limit = order_dates + \
+            rng.integers(1, 8, size=n_items).astype('timedelta64[D]')
+
+        order_items_df = pd.DataFrame({
+            'order_id': orders_df['order_id'].to_numpy()[order_pos],
+            'order_item_id': order_item_ids,
+            'product_id': products_df['product_id'].iloc[product_pos].to_numpy(),
+            'seller_id': sellers_df['seller_id'].iloc[seller_pos].to_numpy(),
+            'shipping_limit_date': shipping_limit,
+            'price': np.round(final_price, 2),
+            'freight_value': np.round(freight_value, 2),
+            'discount_pct': np.round(discount_pct, 2),
+            'coupon_applied': rng.integers(0, 2, size=n_items).astype(bool)
+        })
+        take_keys(order_items_df, orders_df, order_pos, ["order_key"])
+        take_keys(order_items_df, products_df, product_pos, ["product_key"])
+        take_keys(order_items_df, sellers_df, seller_pos, ["seller_key"])
         print(f"   ✓ Generated {len(order_items_df)} order item records")
         return order_items_df
 
@@ -415,52 +604,55 @@ def generate_order_items_data(orders_df, products_df, sellers_df):
         raise
 
 
-def generate_payments_data(orders_df, order_items_df):
-    """Generate payments data with improved installment logic."""
+def generate_payments_data(orders_df, order_items_df, rng):
+    """Generate payments data with vectorized installment logic."""
     print("7. Generating Payments data...")
 
-    payment_types = ["credit_card", "debit_card", "gcash", "paymaya",
-                     "bank_transfer", "cod", "installment"]
+    payment_types = np.array(["credit_card", "debit_card", "gcash", "paymaya",
+                              "bank_transfer", "cod", "installment"])
 
     try:
-        payments_data = []
-
-        for _, order in orders_df.iterrows():
-            order_id = order['order_id']
-            order_total = order_items_df[order_items_df['order_id']
-                                         == order_id]['price'].sum()
-            if order_total == 0:
-                order_total = 100.0  # Default minimum order value
-
-            payment_type = np.random.choice(payment_types)
-
-            if payment_type == "installment":
-                max_installments = max(1, min(12, int(order_total / 1000)))
-                installments = (
-                    np.random.randint(2, max_installments + 1)
-                    if max_installments >= 2
-                    else 1
-                )
-            elif payment_type in ["credit_card", "debit_card"]:
-                installments = np.random.choice(
-                    [1, 3, 6, 12], p=[0.7, 0.15, 0.1, 0.05])
-            else:
-                installments = 1
-
-            # Create payment records
-            for seq in range(1, installments + 1):
-                payment_value = order_total / installments
-
-                payments_data.append({
-                    'order_id': order_id,
-                    'payment_sequential': seq,
-                    'payment_type': payment_type,
-                    'payment_installments': installments,
-                    'payment_value': round(payment_value, 2),
-                    'payment_status': random.choice(['success', 'pending'])
-                })
-
-        payments_df = pd.DataFrame(payments_data)
+        n_orders = len(orders_df)
+        order_totals = (
+            order_items_df.groupby('order_id')['price'].sum()
+            .reindex(orders_df['order_id'], fill_value=0)
+            .to_numpy(dtype=float)
+        )
+        # Default minimum order value
+        order_totals = np.where(order_totals == 0, 100.0, order_totals)
+
+        order_payment_types = payment_types[rng.integers(
+            0, len(payment_types), size=n_orders)]
+        installments = np.ones(n_orders, dtype=int)
+
+        max_installments = np.clip(
+            (order_totals / 1000).astype(int), 1, 12)
+        installment_mask = (order_payment_types == "installment") & (
+            max_installments >= 2)
+        installments[installment_mask] = rng.integers(
+            2, max_installments[installment_mask] + 1)
+
+        card_mask = np.isin(order_payment_types, ["credit_card", "debit_card"])
+        installments[card_mask] = rng.choice(
+            [1, 3, 6, 12], size=int(card_mask.sum()), p=[0.7, 0.15, 0.1, 0.05])
+
+        # Expand into one payment record per installment
+        n_payments = int(installments.sum())
+        order_pos = np.repeat(np.arange(n_orders), installments)
+        first_payment_pos = np.cumsum(installments) - installments
+        payment_sequential = np.arange(
+            n_payments) - np.repeat(first_payment_pos, installments) + 1
+
+        payments_df = pd.DataFrame({
+            'order_id': orders_df['order_id'].to_numpy()[order_pos],
+            'payment_sequential': payment_sequential,
+            'payment_type': order_payment_types[order_pos],
+            'payment_installments': installments[order_pos],
+            'payment_value': np.round(order_totals / installments, 2)[order_pos],
+            'payment_status': np.array(['success', 'pending'])[
+                rng.integers(0, 2, size=n_payments)]
+        })
+        take_keys(payments_df, orders_df, order_pos, ["order_key"])
         print(f"   ✓ Generated {len(payments_df)} payment records")
         return payments_df
 
@@ -469,110 +661,479 @@ def generate_payments_data(orders_df, order_items_df):
         raise
 
 
-def upload_to_s3(s3_client, bucket_name, datasets):
-    """Upload datasets to S3 with proper error handling."""
+def table_seed(seed, name):
+    """Seed for one table's generator, derived from the run seed and the table name."""
+    entropy = [seed] + [ord(c) for c in name]
+    return int(np.random.SeedSequence(entropy).generate_state(1)[0])
+
+
+def build_table(name, inputs, seed=42, n_rows=None, n_workers=1, pooled=False):
+    """
+    Generate one table with its own generator, so the output does not depend
+    on which tables ran before it or in which process. ``inputs`` holds the
+    TABLE_DEPENDENCIES columns of the tables it samples from.
+    Returns (DataFrame, seconds).
+    """
+    start = time.perf_counter()
+    generator, faker = initialize_generators(
+        n_workers, seed=table_seed(seed, name), pooled=pooled)
+
+    if name == "Geolocation":
+        df, _ = generate_geolocation_data(generator, n_rows)
+    elif name == "Customers":
+        df = generate_customers_data(generator, CITIES, n_rows)
+    elif name == "Products":
+        df, _ = generate_products_data(generator, faker, n_rows)
+    elif name == "Sellers":
+        df = generate_sellers_data(generator, CITIES, PRODUCT_CATEGORIES, n_rows)
+    elif name == "Orders":
+        df = generate_orders_data(
+            generator, inputs["Customers"]["customer_id"], n_orders=n_rows,
+            customer_keys=inputs["Customers"].get("customer_key"))
+    elif name == "Order Items":
+        df = generate_order_items_data(
+            inputs["Orders"], inputs["Products"], inputs["Sellers"], generator.spawn_rng())
+    elif name == "Payments":
+        df = generate_payments_data(
+            inputs["Orders"], inputs["Order Items"], generator.spawn_rng())
+    else:
+        raise ValueError(f"Unknown table: {name}")
+
+    return df, time.perf_counter() - start
+
+
+def generate_tables(rows, seed=42, n_workers=1, pooled=False, max_workers=None, on_ready=None):
+    """
+    Generate every table of TABLE_DEPENDENCIES on a process pool. A table is
+    submitted as soon as the tables it samples from are done, so the
+    independent dimensions run concurrently, and ``on_ready(name, df)`` is
+    called in this process as each one finishes (e.g. to start its upload).
+    Returns (datasets, {name: generation seconds}).
+    """
+    pending = {name: set(parents) for name, parents in TABLE_DEPENDENCIES.items()}
+    datasets = {}
+    seconds = {}
+    running = {}
+    max_workers = max_workers or min(os.cpu_count() or 1, len(pending))
+
+    with ProcessPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        while pending or running:
+            ready = [name for name, parents in pending.items() if not parents]
+            for name in ready:
+                del pending[name]
+                inputs = {parent: datasets[parent][columns]
+                          for parent, columns in TABLE_DEPENDENCIES[name].items()}
+                running[executor.submit(build_table, name, inputs, seed, rows.get(name),
+                                        n_workers, pooled)] = name
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                try:
+                    datasets[name], seconds[name] = future.result()
+                except Exception as e:
+                    print(f"❌ Failed to generate {name}: {e}")
+                    for other in running:
+                        other.cancel()
+                    raise
+                print(f"   ✓ {name} ready in {seconds[name]:.2f}s")
+                for parents in pending.values():
+                    parents.discard(name)
+                if on_ready is not None:
+                    on_ready(name, datasets[name])
+
+    # Keep the usual table order for the summary
+    datasets = {name: datasets[name] for name in TABLE_DEPENDENCIES}
+    return datasets, seconds
+
+
+def critical_path(timings):
+    """
+    Longest chain of generation steps ending in an upload, given
+    {name: {"generate": s, "upload": s}}. Returns (tables, seconds).
+    """
+    finished = {}
+    chains = {}
+    for name in TABLE_DEPENDENCIES:
+        parents = [parent for parent in TABLE_DEPENDENCIES[name] if parent in finished]
+        parent = max(parents, key=finished.get, default=None)
+        finished[name] = timings[name]["generate"] + (finished[parent] if parent else 0)
+        chains[name] = (chains[parent] if parent else []) + [name]
+
+    last = max(finished, key=lambda name: finished[name] + timings[name].get("upload", 0))
+    return chains[last], finished[last] + timings[last].get("upload", 0)
+
+
+def bronze_key(name, file_format=BRONZE_FILE_FORMAT, partition=None):
+    """
+    S3 key for a dataset: bronze/data/<table>.<format> for full snapshots,
+    bronze/data/<table>/<partition>/part-0.<format> for incremental runs.
+    """
+    table = name.lower().replace(' ', '_')
+    if partition is None:
+        return f"bronze/data/{table}.{file_format}"
+    return f"bronze/data/{table}/{partition}/part-0.{file_format}"
+
+
+def dataset_exists(s3_client, bucket_name, path):
+    """Check whether a dataset object is already in S3."""
+    filename = path.split("bronze/data/", 1)[-1]
+
+    try:
+        s3_client.head_object(Bucket=bucket_name,
+                              Key=path)
+        print(
+            f"⚠️  File already exists in MinIO, skipping: {filename}")
+        return True
+
+    except ClientError as e:
+        if e.response['Error']['Code'] != '404':
+            print(f"❌ Error checking {filename}: {e}")
+            raise
+        return False
+
+
+def upload_dataset(s3_client, bucket_name, name, df, file_format=BRONZE_FILE_FORMAT,
+                   part_size=UPLOAD_PART_SIZE, partition=None):
+    """Stream one dataset to S3 unless it is already there. Returns True if uploaded."""
+    path = bronze_key(name, file_format, partition)
+    filename = path.split("bronze/data/", 1)[-1]
+
+    if dataset_exists(s3_client, bucket_name, path):
+        return False
+
+    try:
+        start = time.perf_counter()
+        n_bytes = upload_bronze_object(
+            s3_client, bucket_name, path, bronze_table_for_key(path), df,
+            file_format, part_size=part_size)
+        print(
+            f"✓ Uploaded to MinIO: {filename} ({len(df)} records, "
+            f"{n_bytes / 2**20:.1f} MB in {time.perf_counter() - start:.2f}s)")
+        return True
+
+    except Exception as upload_error:
+        print(
+            f"❌ Failed to upload {filename}: {upload_error}")
+        raise
+
+
+def upload_to_s3(s3_client, bucket_name, datasets, file_format=BRONZE_FILE_FORMAT,
+                 max_workers=4, part_size=UPLOAD_PART_SIZE, partition=None):
+    """
+    Upload datasets to S3 as Parquet (zstd) or CSV, streaming each table
+    into a multipart upload and sending up to ``max_workers`` tables at once.
+    With ``partition`` (e.g. "dt=2026-10-18") each table goes to a Hive-style
+    partition key instead of the full snapshot key.
+    """
     print("8. Uploading datasets to MinIO...")
 
-    uploaded_count = 0
-    skipped_count = 0
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        futures = [executor.submit(upload_dataset, s3_client, bucket_name, name, df,
+                                   file_format, part_size, partition)
+                   for name, df in datasets.items()]
+        uploaded = [future.result() for future in futures]
 
-    for name, df in datasets.items():
-        filename = f"{name.lower().replace(' ', '_')}.csv"
-        path = f"bronze/data/{filename}"
+    uploaded_count = sum(uploaded)
+    skipped_count = len(uploaded) - uploaded_count
+    print(
+        f"Upload summary: {uploaded_count} uploaded, {skipped_count} skipped")
 
-        try:
-            s3_client.head_object(Bucket=bucket_name,
-                                  Key=path)
+
+def open_dataset_writer(s3_client, bucket_name, name, file_format=BRONZE_FILE_FORMAT,
+                        part_size=UPLOAD_PART_SIZE):
+    """BronzeObjectWriter for a full-snapshot dataset, or None if it is already in S3."""
+    path = bronze_key(name, file_format)
+    if dataset_exists(s3_client, bucket_name, path):
+        return None
+    return BronzeObjectWriter(s3_client, bucket_name, path, bronze_table_for_key(path),
+                              file_format, part_size=part_size)
+
+
+def stream_dataset(s3_client, bucket_name, name, chunks, file_format=BRONZE_FILE_FORMAT,
+                   part_size=UPLOAD_PART_SIZE, key_columns=None):
+    """
+    Upload a table generated chunk by chunk into one S3 object. Only
+    ``key_columns`` are kept, for the tables that sample from this one.
+    Returns ((rows, columns), kept key columns or None).
+    """
+    writer = open_dataset_writer(s3_client, bucket_name, name, file_format, part_size)
+    filename = bronze_key(name, file_format).split("bronze/data/", 1)[-1]
+    kept = []
+    rows = columns = 0
+
+    try:
+        start = time.perf_counter()
+        # Generated even when the object exists, so the keys stay consistent
+        for chunk in chunks:
+            if writer is not None:
+                writer.write(chunk)
+            if key_columns:
+                kept.append(chunk[key_columns])
+            rows += len(chunk)
+            columns = len(chunk.columns)
+        if writer is not None:
+            writer.close()
             print(
-                f"⚠️  File already exists in MinIO, skipping: {filename}")
-            skipped_count += 1
+                f"✓ Uploaded to MinIO: {filename} ({rows} records, "
+                f"{writer.bytes_written / 2**20:.1f} MB in {time.perf_counter() - start:.2f}s)")
 
-        except ClientError as e:
-            if e.response['Error']['Code'] == '404':
-                try:
-                    csv_buffer = StringIO()
-                    df.to_csv(csv_buffer, index=False)
-                    csv_buffer.seek(0)
-
-                    s3_client.put_object(
-                        Bucket=bucket_name,
-                        Key=path,
-                        Body=csv_buffer.getvalue(),
-                        ContentType='text/csv'
-                    )
-                    print(
-                        f"✓ Uploaded to MinIO: {filename} ({len(df)} records)")
-                    uploaded_count += 1
-
-                except Exception as upload_error:
-                    print(
-                        f"❌ Failed to upload {filename}: {upload_error}")
-                    raise
-            else:
-                print(f"❌ Error checking {filename}: {e}")
-                raise
+    except Exception as upload_error:
+        if writer is not None:
+            writer.abort()
+        print(f"❌ Failed to upload {filename}: {upload_error}")
+        raise
 
+    keys = pd.concat(kept, ignore_index=True) if kept else None
+    return (rows, columns), keys
+
+
+def generate_full_dataset(generator, faker, s3_client, bucket_name, scale_factor=1,
+                          file_format=BRONZE_FILE_FORMAT, part_size=UPLOAD_PART_SIZE,
+                          chunk_rows=UPLOAD_CHUNK_ROWS):
+    """
+    Generate the full history at ``scale_factor`` and stream it to S3 one
+    chunk at a time. Dimensions are uploaded one after another keeping only
+    the columns later tables sample from (customer, product and seller ids,
+    product prices). Every orders chunk is expanded into its order items and
+    payments, and the three tables are written to their own uploads side by
+    side, so memory is bounded by the chunk size rather than the scale
+    factor. Returns {name: (rows, columns)} for print_summary.
+    """
+    rows = scaled_rows(scale_factor)
+    summary = {}
+    print(f"Streaming scale factor {scale_factor} in chunks of {chunk_rows:,} rows")
+
+    def stream(name, chunks, key_columns=None):
+        summary[name], keys = stream_dataset(
+            s3_client, bucket_name, name, chunks, file_format, part_size, key_columns)
+        return keys
+
+    geoloc_chunks, city_region_mapping = generate_geolocation_data(
+        generator, rows["Geolocation"], chunk_rows)
+    stream("Geolocation", geoloc_chunks)
+
+    customer_keys = stream("Customers", generate_customers_data(
+        generator, CITIES, rows["Customers"], chunk_rows), with_keys(["customer_id"]))
+    product_chunks, product_categories = generate_products_data(
+        generator, faker, rows["Products"], chunk_rows)
+    product_keys = stream("Products", product_chunks, with_keys(["product_id", "product_price"]))
+    seller_keys = stream("Sellers", generate_sellers_data(
+        generator, CITIES, product_categories, rows["Sellers"], chunk_rows), with_keys(["seller_id"]))
+
+    orders_chunks = generate_orders_data(
+        generator, customer_keys["customer_id"], n_orders=rows["Orders"], chunk_rows=chunk_rows,
+        customer_keys=customer_keys.get("customer_key"))
+    items_rng = generator.spawn_rng()
+    payments_rng = generator.spawn_rng()
+
+    facts = ["Orders", "Order Items", "Payments"]
+    writers = {name: open_dataset_writer(s3_client, bucket_name, name, file_format, part_size)
+               for name in facts}
+    counts = {name: [0, 0] for name in facts}
+    try:
+        start = time.perf_counter()
+        for orders_df in orders_chunks:
+            order_items_df = generate_order_items_data(
+                orders_df, product_keys, seller_keys, items_rng)
+            payments_df = generate_payments_data(
+                orders_df, order_items_df, payments_rng)
+            for name, df in zip(facts, (orders_df, order_items_df, payments_df)):
+                if writers[name] is not None:
+                    writers[name].write(df)
+                counts[name][0] += len(df)
+                counts[name][1] = len(df.columns)
+        for name, writer in writers.items():
+            if writer is not None:
+                writer.close()
+                print(
+                    f"✓ Uploaded to MinIO: {bronze_key(name, file_format).split('bronze/data/', 1)[-1]} "
+                    f"({counts[name][0]} records, {writer.bytes_written / 2**20:.1f} MB "
+                    f"in {time.perf_counter() - start:.2f}s)")
+
+    except Exception as upload_error:
+        for writer in writers.values():
+            if writer is not None:
+                writer.abort()
+        print(f"❌ Failed to upload orders, order items and payments: {upload_error}")
+        raise
+
+    summary.update({name: tuple(count) for name, count in counts.items()})
+    return summary
+
+
+def generate_and_upload(s3_client, bucket_name, rows, file_format=BRONZE_FILE_FORMAT,
+                        n_workers=1, pooled=False, upload_workers=4,
+                        part_size=UPLOAD_PART_SIZE, seed=42):
+    """
+    Run generate_tables and upload each table the moment it is generated,
+    while the tables that depend on it are still being built.
+    Returns (datasets, {name: {"generate": s, "upload": s}}).
+    """
+    print("Generating tables and uploading them to MinIO as they are ready...")
+    uploads = {}
+
+    def timed_upload(name, df):
+        start = time.perf_counter()
+        uploaded = upload_dataset(s3_client, bucket_name, name, df, file_format, part_size)
+        return uploaded, time.perf_counter() - start
+
+    with ThreadPoolExecutor(max_workers=max(1, upload_workers)) as uploader:
+        datasets, generate_seconds = generate_tables(
+            rows, seed, n_workers, pooled,
+            on_ready=lambda name, df: uploads.__setitem__(
+                name, uploader.submit(timed_upload, name, df)))
+        results = {name: future.result() for name, future in uploads.items()}
+
+    uploaded_count = sum(uploaded for uploaded, _ in results.values())
     print(
-        f"Upload summary: {uploaded_count} uploaded, {skipped_count} skipped")
+        f"Upload summary: {uploaded_count} uploaded, {len(results) - uploaded_count} skipped")
+    timings = {name: {"generate": generate_seconds[name], "upload": results[name][1]}
+               for name in datasets}
+    return datasets, timings
+
+
+def load_dimension(s3_client, bucket_name, name, columns, file_format=BRONZE_FILE_FORMAT):
+    """Read selected columns of an uploaded full-snapshot dataset back from S3."""
+    path = bronze_key(name, file_format)
+    print(f"   Loading {', '.join(columns)} from {path}")
+    body = s3_client.get_object(Bucket=bucket_name, Key=path)["Body"].read()
+    if file_format == "parquet":
+        return pd.read_parquet(io.BytesIO(body), columns=columns)
+    return pd.read_csv(io.BytesIO(body), usecols=columns)
+
+
+def generate_incremental_data(generator, s3_client, bucket_name, window_start, hourly=False,
+                              n_orders=5000, file_format=BRONZE_FILE_FORMAT):
+    """
+    Generate one day's (or hour's) orders, order items and payments against
+    the customer, product and seller dimensions already in S3.
+    Returns (datasets, partition).
+    """
+    if n_orders >= INCREMENTAL_KEY_STRIDE:
+        raise ValueError(
+            f"n_orders must be below {INCREMENTAL_KEY_STRIDE:,} per window, or order keys overlap")
+    window_start = pd.Timestamp(window_start).floor("h" if hourly else "D")
+    window_end = window_start + pd.Timedelta(hours=1 if hourly else 24) - pd.Timedelta(seconds=1)
+    tag = window_start.strftime("%Y%m%d%H" if hourly else "%Y%m%d")
+    partition = f"dt={window_start:%Y-%m-%d}" + (f"/hr={window_start:%H}" if hourly else "")
+    print(f"Incremental window {window_start} .. {window_end} -> {partition}")
+
+    customers_df = load_dimension(
+        s3_client, bucket_name, "Customers", with_keys(["customer_id"]), file_format)
+    products_df = load_dimension(
+        s3_client, bucket_name, "Products", with_keys(["product_id", "product_price"]), file_format)
+    sellers_df = load_dimension(
+        s3_client, bucket_name, "Sellers", with_keys(["seller_id"]), file_format)
+
+    # Order ids and keys carry the window so they never collide with other
+    # runs (or with the full history's 10-digit keys)
+    orders_df = generate_orders_data(
+        generator, customers_df['customer_id'], n_orders=n_orders,
+        start=window_start.isoformat(), end=window_end.isoformat(),
+        id_prefix=f"ORD_{tag}", id_start=1,
+        customer_keys=customers_df.get('customer_key'), key_start=int(tag) * INCREMENTAL_KEY_STRIDE + 1)
+    order_items_df = generate_order_items_data(
+        orders_df, products_df, sellers_df, generator.spawn_rng())
+    payments_df = generate_payments_data(
+        orders_df, order_items_df, generator.spawn_rng())
+
+    datasets = {
+        "Orders": orders_df,
+        "Order Items": order_items_df,
+        "Payments": payments_df
+    }
+    return datasets, partition
 
 
-def print_summary(datasets):
-    """Print a summary of generated datasets."""
+def print_summary(datasets, timings=None):
+    """
+    Print a summary of generated datasets, with per-table generate/upload
+    times and the critical path when ``timings`` is given.
+    """
     print("\n=== Dataset Summary ===")
     total_records = 0
 
     for name, df in datasets.items():
-        record_count = len(df)
-        column_count = len(df.columns)
-        print(
-            f"{name:<20}: {record_count:>8,} records | {column_count:>2} columns")
+        # Streamed tables are reported as (rows, columns)
+        record_count, column_count = df if isinstance(df, tuple) else (len(df), len(df.columns))
+        line = f"{name:<20}: {record_count:>8,} records | {column_count:>2} columns"
+        if timings and name in timings:
+            line += (f" | generate {timings[name]['generate']:7.2f}s"
+                     f" | upload {timings[name].get('upload', 0):6.2f}s")
+        print(line)
         total_records += record_count
 
     print(f"{'TOTAL':<20}: {total_records:>8,} records")
+    if timings:
+        tables, seconds = critical_path(timings)
+        print(f"Critical path: {' -> '.join(tables)} -> upload ({seconds:.2f}s)")
 
 
 if __name__ == "__main__":
     """Main function to orchestrate the data generation process."""
-    try:
-        generator, faker = initialize_generators()
+    parser = argparse.ArgumentParser(
+        description="Generate the synthetic e-commerce dataset and upload it to MinIO")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Processes used by RandomDatasetGenerator for each table")
+    parser.add_argument("--format", choices=["parquet", "csv"], default=BRONZE_FILE_FORMAT,
+                        help="File format of the uploaded bronze objects")
+    parser.add_argument("--upload-workers", type=int, default=4,
+                        help="Tables uploaded to MinIO at the same time")
+    parser.add_argument("--part-size-mb", type=int, default=UPLOAD_PART_SIZE // 2**20,
+                        help="Multipart upload part size (MiB, at least 5)")
+    parser.add_argument("--mode", choices=["full", "incremental"], default="full",
+                        help="full: regenerate the whole history; incremental: one day/hour of orders")
+    parser.add_argument("--date", default=datetime.utcnow().strftime("%Y-%m-%d"),
+                        help="Day generated in incremental mode (YYYY-MM-DD)")
+    parser.add_argument("--hour", type=int, default=None,
+                        help="Generate a single hour of the day instead of the whole day")
+    parser.add_argument("--orders", type=int, default=None,
+                        help="Orders generated per incremental window (default: scaled by --scale-factor)")
+    parser.add_argument("--scale-factor", type=float, default=1,
+                        help="Scales every table proportionally (1 = 20,000 customers and 5,000 orders)")
+    parser.add_argument("--chunk-rows", type=int, default=UPLOAD_CHUNK_ROWS,
+                        help="Rows generated and uploaded at a time once a table outgrows one chunk")
+    args = parser.parse_args()
+    rows = scaled_rows(args.scale_factor)
+    pooled = args.scale_factor >= POOLED_SCALE_FACTOR
 
+    try:
         s3_client = create_s3_client()
         bucket_name = 'data-pipeline-storage'
         ensure_bucket_exists(s3_client, bucket_name)
 
-        geoloc_df, city_region_mapping = generate_geolocation_data(generator)
-
-        cities = list(city_region_mapping.keys())
-        regions = list(set(info["region"]
-                       for info in city_region_mapping.values()))
-
-        customers_df = generate_customers_data(generator, cities, regions)
-        products_df, product_categories = generate_products_data(
-            generator, faker)
-        sellers_df = generate_sellers_data(
-            generator, cities, regions, product_categories)
+        if args.mode == "incremental":
+            window_start = pd.Timestamp(args.date) + pd.Timedelta(hours=args.hour or 0)
+            # Seeded by the window so re-running a day reproduces it exactly
+            generator, faker = initialize_generators(
+                args.workers, seed=int(window_start.strftime("%Y%m%d%H")), pooled=pooled)
+            datasets, partition = generate_incremental_data(
+                generator, s3_client, bucket_name, window_start, hourly=args.hour is not None,
+                n_orders=args.orders or rows["Orders"], file_format=args.format)
+            print_summary(datasets)
+            upload_to_s3(s3_client, bucket_name, datasets, args.format,
+                         max_workers=args.upload_workers, part_size=args.part_size_mb * 2**20,
+                         partition=partition)
+            print("✅ Incremental data generation and upload completed successfully!")
+
+        elif max(rows.values()) > args.chunk_rows:
+            generator, faker = initialize_generators(args.workers, pooled=pooled)
+            summary = generate_full_dataset(
+                generator, faker, s3_client, bucket_name, args.scale_factor, args.format,
+                part_size=args.part_size_mb * 2**20, chunk_rows=args.chunk_rows)
+            print_summary(summary)
+            print("✅ Data generation and upload completed successfully!")
 
-        customer_ids = customers_df['customer_id'].tolist()
-        orders_df = generate_orders_data(generator, customer_ids)
-
-        order_items_df = generate_order_items_data(
-            orders_df, products_df, sellers_df)
-        payments_df = generate_payments_data(orders_df, order_items_df)
-
-        datasets = {
-            "Geolocation": geoloc_df,
-            "Customers": customers_df,
-            "Sellers": sellers_df,
-            "Products": products_df,
-            "Orders": orders_df,
-            "Order Items": order_items_df,
-            "Payments": payments_df
-        }
-
-        print_summary(datasets)
-        upload_to_s3(s3_client, bucket_name, datasets)
-
-        print("✅ Data generation and upload completed successfully!")
+        else:
+            start = time.perf_counter()
+            datasets, timings = generate_and_upload(
+                s3_client, bucket_name, rows, args.format, n_workers=args.workers, pooled=pooled,
+                upload_workers=args.upload_workers, part_size=args.part_size_mb * 2**20)
+            print_summary(datasets, timings)
+            print(f"Wall clock: {time.perf_counter() - start:.2f}s")
+
+            print("✅ Data generation and upload completed successfully!")
 
     except Exception as e:
         print(f"❌ Fatal error in main process: {e}")
@@ -3,6 +3,9 @@
     tags=['gold', 'facts', 'seller_performance']
 ) }}
 
+{# Join and count on the BIGINT surrogate keys when the data carries them #}
+{% set key = 'key' if var('compact_keys') else 'id' %}
+
 SELECT
     s.seller_id,
     {% if target.name == 'dev' %}
@@ -12,10 +15,10 @@ SELECT
     {% endif %}
 
     -- Volume metrics
-    COUNT(DISTINCT oi.order_id) AS orders_count,
+    COUNT(DISTINCT oi.order_{{ key }}) AS orders_count,
     COUNT(oi.order_item_id) AS items_sold,
-    COUNT(DISTINCT oi.product_id) AS unique_products_sold,
-    COUNT(DISTINCT o.customer_id) AS unique_customers,
+    COUNT(DISTINCT oi.product_{{ key }}) AS unique_products_sold,
+    COUNT(DISTINCT o.customer_{{ key }}) AS unique_customers,
     
     -- Revenue metrics
     SUM(oi.price) AS gross_revenue,
@@ -42,9 +45,9 @@ SELECT
 
 FROM {{ ref('sellers') }} s
 JOIN {{ ref('order_items') }} oi 
-    ON s.seller_id = oi.seller_id
+    ON s.seller_{{ key }} = oi.seller_{{ key }}
 JOIN {{ ref('orders') }} o 
-    ON oi.order_id = o.order_id
+    ON oi.order_{{ key }} = o.order_{{ key }}
 GROUP BY 
     s.seller_id,
     {% if target.name == 'dev' %}
@@ -8,6 +8,9 @@ SELECT
     order_item_id,
     product_id,
     seller_id,
+    order_key,
+    product_key,
+    seller_key,
     shipping_limit_date,
     price,
     freight_value,
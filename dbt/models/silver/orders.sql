@@ -6,6 +6,8 @@
 SELECT
     order_id,
     customer_id,
+    order_key,
+    customer_key,
     UPPER(TRIM(order_status)) AS order_status,
     order_purchase_timestamp,
     order_estimated_delivery_date,
@@ -5,6 +5,7 @@
 
 SELECT
     seller_id,
+    seller_key,
     DATE(seller_signup_date) AS seller_signup_date,
     UPPER(TRIM(seller_category_specialization)) AS seller_category_specialization,
     COALESCE(seller_rating, 0) AS seller_rating,
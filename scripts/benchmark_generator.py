@@ -0,0 +1,314 @@
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+import duckdb
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(
+    os.path.abspath(__file__)), "..", "dags", "functions"))
+
+from DataRandomizer import RandomDatasetGenerator, sequential_ids  # noqa: E402
+import data_created  # noqa: E402
+
+
+BENCH_COLUMNS = {
+    "customer_name": {"name": "customer_name", "type": "name"},
+    "product_description": {"name": "product_description", "type": "paragraph",
+                            "params": {"nb_sentences": 3}},
+}
+
+
+def rows_per_second(generator, column_config, n_rows):
+    """Time a single-column generate_dataset call and return rows/sec."""
+    start = time.perf_counter()
+    generator.generate_dataset(n_rows=n_rows, columns_config=[column_config])
+    elapsed = time.perf_counter() - start
+    return n_rows / elapsed, elapsed
+
+
+def bench_pooled(rows, baseline_rows, pool_size):
+    """Compare per-row Faker generation against pooled sampling."""
+    print(f"=== Pooled Faker sampling ({rows:,} rows, pool={pool_size:,}) ===")
+
+    for col_name, column_config in BENCH_COLUMNS.items():
+        baseline = RandomDatasetGenerator(seed=42)
+        base_rps, base_time = rows_per_second(
+            baseline, column_config, baseline_rows)
+
+        pooled = RandomDatasetGenerator(
+            seed=42, pooled=True, pool_size=pool_size)
+        # First call builds the pool, so time it separately
+        build_start = time.perf_counter()
+        pooled.generate_dataset(n_rows=1, columns_config=[column_config])
+        build_time = time.perf_counter() - build_start
+        pooled_rps, pooled_time = rows_per_second(pooled, column_config, rows)
+
+        print(f"{col_name:<20}: faker {base_rps:>12,.0f} rows/s ({base_time:.2f}s @ {baseline_rows:,}) | "
+              f"pooled {pooled_rps:>12,.0f} rows/s ({pooled_time:.2f}s, pool build {build_time:.2f}s) | "
+              f"speedup {pooled_rps / base_rps:,.1f}x")
+
+
+def bench_streaming(rows, chunk_size):
+    """Compare peak traced memory of generate_dataset against generate_dataset_iter."""
+    print(f"=== Streaming generation ({rows:,} rows, chunk={chunk_size:,}) ===")
+    columns_config = [
+        {"name": "order_id", "type": "custom", "params": {
+            "prefix": "ORD", "delimiter": "_", "start": 1000000001}},
+        {"name": "order_status", "type": "category",
+            "choices": ["delivered", "shipped", "processing", "canceled", "pending"]},
+        {"name": "order_value", "type": "float",
+            "params": {"min": 20, "max": 5000}},
+    ]
+
+    generator = RandomDatasetGenerator(seed=42)
+    tracemalloc.start()
+    start = time.perf_counter()
+    generator.generate_dataset(n_rows=rows, columns_config=columns_config)
+    single_time = time.perf_counter() - start
+    _, single_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    generator = RandomDatasetGenerator(seed=42)
+    tracemalloc.start()
+    start = time.perf_counter()
+    for _ in generator.generate_dataset_iter(rows, columns_config, chunk_size=chunk_size):
+        pass
+    iter_time = time.perf_counter() - start
+    _, iter_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"single-shot : {single_time:6.2f}s | peak {single_peak / 2**20:8.1f} MiB")
+    print(f"streaming   : {iter_time:6.2f}s | peak {iter_peak / 2**20:8.1f} MiB")
+
+
+def bench_plan(rows, chunk_size):
+    """Split DatasetPlan compile time from generation time over a chunked run."""
+    print(f"=== DatasetPlan compile vs generate ({rows:,} rows, chunk={chunk_size:,}) ===")
+    columns_config = [
+        {"name": "order_id", "type": "custom", "params": {
+            "prefix": "ORD", "delimiter": "_", "start": 1000000001}},
+        {"name": "order_status", "type": "category",
+            "choices": ["delivered", "shipped", "processing", "canceled", "pending"],
+            "params": {"weights": [0.6, 0.2, 0.1, 0.05, 0.05]}},
+        {"name": "customer_city", "type": "category", "choices": data_created.CITIES},
+        {"name": "customer_region", "type": "category",
+            "depends_on": {"column": "customer_city", "function": "map"},
+            "params": {"mapping": data_created.CITY_TO_REGION}},
+        {"name": "order_purchase_timestamp", "type": "datetime", "params": {
+            "start": "2000-01-01T00:00:00", "end": "2024-12-31T23:59:59"}},
+    ]
+
+    generator = RandomDatasetGenerator(seed=42)
+    start = time.perf_counter()
+    plan = generator.plan(columns_config)
+    compile_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in generator.generate_dataset_iter(rows, plan, chunk_size=chunk_size):
+        pass
+    generate_time = time.perf_counter() - start
+
+    print(f"compile  : {compile_time * 1000:8.3f} ms (once per plan)")
+    print(f"generate : {generate_time:8.2f} s | {rows / generate_time:>12,.0f} rows/s")
+
+
+def bench_memory(rows, pool_size):
+    """
+    Compare the in-memory footprint of the generated products and orders
+    tables as pandas DataFrames (deep memory_usage) and as Arrow tables
+    (dictionary-encoded categories, strings in Arrow buffers).
+    """
+    print(f"=== pandas vs Arrow output ({rows:,} rows, pool={pool_size:,}) ===")
+    tables = {
+        "products": data_created.products_columns(),
+        "orders": data_created.orders_columns(),
+    }
+    for name, columns_config in tables.items():
+        results = {}
+        for output in ("pandas", "arrow"):
+            generator = RandomDatasetGenerator(seed=42, pooled=True, pool_size=pool_size)
+            plan = generator.plan(columns_config)
+            generator.generate_dataset(n_rows=1, columns_config=plan)  # build Faker pools
+            start = time.perf_counter()
+            data = generator.generate_dataset(
+                n_rows=rows, columns_config=plan, include_index=False, output=output)
+            elapsed = time.perf_counter() - start
+            n_bytes = data.nbytes if output == "arrow" else data.memory_usage(deep=True, index=False).sum()
+            results[output] = n_bytes
+            print(f"{name:<9} {output:<7}: {n_bytes / 2**20:8.1f} MiB | {elapsed:6.2f}s")
+            del data
+        print(f"{name:<9} ratio  : {results['pandas'] / results['arrow']:8.2f}x smaller as Arrow")
+
+
+def synthetic_tables(n_orders, n_products=20_000, n_sellers=5_000, seed=42):
+    """Build minimal orders/products/sellers frames without going through Faker."""
+    rng = np.random.default_rng(seed)
+    start = np.datetime64("2000-01-01T00:00:00")
+    orders_df = pd.DataFrame({
+        "order_id": np.char.add("ORD_", np.arange(1000000001, 1000000001 + n_orders).astype(str)),
+        "order_purchase_timestamp": start + rng.integers(0, 788_918_400, size=n_orders).astype("timedelta64[s]"),
+    })
+    products_df = pd.DataFrame({
+        "product_id": np.char.add("PROD_", np.arange(100000001, 100000001 + n_products).astype(str)),
+        "product_price": rng.uniform(20, 100_000, size=n_products).round(2),
+    })
+    sellers_df = pd.DataFrame({
+        "seller_id": np.char.add("SELL_", np.arange(100001, 100001 + n_sellers).astype(str)),
+    })
+    return orders_df, products_df, sellers_df
+
+
+# gold.seller_performance_facts as rendered for DuckDB, on either the text
+# ids or the compact BIGINT keys (compact_keys dbt var)
+SELLER_JOIN_SQL = """
+SELECT COUNT(*)
+FROM sellers s
+JOIN order_items oi ON s.seller_{key} = oi.seller_{key}
+JOIN orders o ON oi.order_{key} = o.order_{key}
+"""
+SELLER_PERFORMANCE_SQL = """
+SELECT
+    s.seller_id,
+    DATE_TRUNC('month', CAST(o.order_purchase_timestamp AS TIMESTAMP)) AS month_year,
+    COUNT(DISTINCT oi.order_{key}) AS orders_count,
+    COUNT(oi.order_item_id) AS items_sold,
+    COUNT(DISTINCT oi.product_{key}) AS unique_products_sold,
+    COUNT(DISTINCT o.customer_{key}) AS unique_customers,
+    SUM(oi.price) AS gross_revenue,
+    SUM(oi.discounted_price) AS net_revenue,
+    SUM(oi.freight_value) AS freight_revenue,
+    SUM(oi.total_item_cost) AS total_revenue,
+    AVG(oi.price) AS avg_item_price,
+    AVG(oi.discount_pct) AS avg_discount_pct,
+    COUNT(CASE WHEN o.delivery_performance = 'ON_TIME' THEN 1 END) AS on_time_deliveries,
+    COUNT(CASE WHEN o.delivery_performance = 'LATE' THEN 1 END) AS late_deliveries
+FROM sellers s
+JOIN order_items oi ON s.seller_{key} = oi.seller_{key}
+JOIN orders o ON oi.order_{key} = o.order_{key}
+GROUP BY s.seller_id, DATE_TRUNC('month', CAST(o.order_purchase_timestamp AS TIMESTAMP))
+"""
+
+
+def bench_ids(rows, n_orders, repeats=3):
+    """
+    Time sequential ID generation (per-row f-strings, the vectorized builder
+    and compact BIGINT keys), then the seller_performance_facts joins in
+    DuckDB on text ids against the compact keys.
+    """
+    print(f"=== Sequential IDs ({rows:,} rows) ===")
+    builders = {
+        "f-string loop": lambda: np.array([f"ORD_{1000000001 + i}" for i in range(rows)]),
+        "sequential_ids": lambda: sequential_ids("ORD_", 1000000001, rows),
+        "compact keys": lambda: np.arange(1000000001, 1000000001 + rows, dtype=np.int64),
+    }
+    for label, build in builders.items():
+        start = time.perf_counter()
+        build()
+        elapsed = time.perf_counter() - start
+        if label == "f-string loop":
+            loop_time = elapsed
+        print(f"{label:<15}: {elapsed:6.2f}s | {rows / elapsed:>12,.0f} rows/s | "
+              f"speedup {loop_time / elapsed:,.1f}x")
+    for label, params in (("order_id column", {}), ("order_key column", {"compact": True})):
+        generator = RandomDatasetGenerator(seed=42)
+        column = {"name": "order_id", "type": "custom",
+                  "params": {"prefix": "ORD", "delimiter": "_", "start": 1000000001, **params}}
+        row_rate, elapsed = rows_per_second(generator, column, rows)
+        print(f"{label:<17}: {elapsed:6.2f}s | {row_rate:>12,.0f} rows/s (generate_dataset)")
+
+    print(f"=== seller_performance_facts join in DuckDB ({n_orders:,} orders) ===")
+    orders_df, products_df, sellers_df = synthetic_tables(n_orders)
+    rng = np.random.default_rng(42)
+    orders_df["order_key"] = np.arange(1000000001, 1000000001 + len(orders_df))
+    products_df["product_key"] = np.arange(100000001, 100000001 + len(products_df))
+    sellers_df["seller_key"] = np.arange(100001, 100001 + len(sellers_df))
+    orders_df["customer_key"] = rng.integers(10000001, 10400001, len(orders_df))
+    orders_df["customer_id"] = np.char.add("CUST-", orders_df["customer_key"].to_numpy().astype(str))
+    orders_df["delivery_performance"] = np.array(["ON_TIME", "LATE", "PENDING"])[
+        rng.integers(0, 3, len(orders_df))]
+    order_items_df = data_created.generate_order_items_data(orders_df, products_df, sellers_df, rng)
+
+    con = duckdb.connect()
+    con.execute("CREATE TABLE sellers AS SELECT * FROM sellers_df")
+    con.execute("CREATE TABLE orders AS SELECT * FROM orders_df")
+    con.execute("""
+        CREATE TABLE order_items AS SELECT *,
+            price * (1 - discount_pct / 100.0) AS discounted_price,
+            price * (1 - discount_pct / 100.0) + freight_value AS total_item_cost
+        FROM order_items_df""")
+    results = {}
+    for label, template in (("joins", SELLER_JOIN_SQL), ("full model", SELLER_PERFORMANCE_SQL)):
+        for key in ("id", "key"):
+            sql = template.format(key=key)
+            con.execute(sql).fetchall()  # warm up
+            start = time.perf_counter()
+            for _ in range(repeats):
+                results[label, key] = con.execute(sql).fetchall()
+            elapsed = (time.perf_counter() - start) / repeats
+            print(f"{label:<10} on *_{key:<3}: {elapsed:6.3f}s per run ({len(order_items_df):,} items)")
+    con.close()
+    assert (sorted(results["full model", "id"], key=str)
+            == sorted(results["full model", "key"], key=str))
+
+
+def bench_order_items(order_counts):
+    """Show generate_order_items_data stays linear in the number of orders."""
+    print("=== generate_order_items_data scaling ===")
+    for n_orders in order_counts:
+        orders_df, products_df, sellers_df = synthetic_tables(n_orders)
+        start = time.perf_counter()
+        order_items_df = data_created.generate_order_items_data(
+            orders_df, products_df, sellers_df, np.random.default_rng(42))
+        elapsed = time.perf_counter() - start
+        print(f"{n_orders:>12,} orders -> {len(order_items_df):>12,} items | "
+              f"{elapsed:8.2f}s | {len(order_items_df) / elapsed:>12,.0f} items/s")
+
+
+def bench_payments(order_counts):
+    """Show generate_payments_data stays linear in the number of orders."""
+    print("=== generate_payments_data scaling ===")
+    for n_orders in order_counts:
+        orders_df, products_df, sellers_df = synthetic_tables(n_orders)
+        order_items_df = data_created.generate_order_items_data(
+            orders_df, products_df, sellers_df, np.random.default_rng(42))
+        start = time.perf_counter()
+        payments_df = data_created.generate_payments_data(
+            orders_df, order_items_df, np.random.default_rng(42))
+        elapsed = time.perf_counter() - start
+        print(f"{n_orders:>12,} orders -> {len(payments_df):>12,} payments | "
+              f"{elapsed:8.2f}s | {n_orders / elapsed:>12,.0f} orders/s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmarks for RandomDatasetGenerator")
+    parser.add_argument("--bench", choices=["pooled", "streaming", "plan", "memory", "ids", "order_items", "payments"],
+                        default="pooled")
+    parser.add_argument("--rows", type=int, default=10_000_000)
+    parser.add_argument("--baseline-rows", type=int, default=50_000,
+                        help="Rows for the per-row Faker baseline (extrapolated as rows/sec)")
+    parser.add_argument("--pool-size", type=int, default=10_000)
+    parser.add_argument("--chunk-size", type=int, default=100_000)
+    parser.add_argument("--orders", type=int, nargs="+",
+                        default=[5_000, 50_000, 500_000, 5_000_000, 20_000_000],
+                        help="Order counts for the order_items/payments scaling benchmarks")
+    args = parser.parse_args()
+
+    if args.bench == "pooled":
+        bench_pooled(args.rows, args.baseline_rows, args.pool_size)
+    elif args.bench == "streaming":
+        bench_streaming(args.rows, args.chunk_size)
+    elif args.bench == "plan":
+        bench_plan(args.rows, args.chunk_size)
+    elif args.bench == "memory":
+        bench_memory(args.rows, args.pool_size)
+    elif args.bench == "ids":
+        bench_ids(args.rows, args.orders[-1])
+    elif args.bench == "order_items":
+        bench_order_items(args.orders)
+    elif args.bench == "payments":
+        bench_payments(args.orders)
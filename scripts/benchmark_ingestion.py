@@ -0,0 +1,251 @@
+import argparse
+import io
+import os
+import sys
+import tempfile
+import time
+
+import boto3
+import duckdb
+
+import numpy as np
+import pandas as pd
+import psycopg2
+import sqlalchemy
+
+sys.path.insert(0, os.path.join(os.path.dirname(
+    os.path.abspath(__file__)), "..", "dags", "functions"))
+
+import bronze  # noqa: E402
+import data_created  # noqa: E402
+from benchmark_generator import synthetic_tables  # noqa: E402
+
+
+def order_items_df(n_orders):
+    """Build a synthetic order items table."""
+    orders_df, products_df, sellers_df = synthetic_tables(n_orders)
+    return data_created.generate_order_items_data(
+        orders_df, products_df, sellers_df, np.random.default_rng(42))
+
+
+def to_csv_bytes(df):
+    buffer = io.StringIO()
+    df.to_csv(buffer, index=False)
+    return buffer.getvalue().encode("utf-8")
+
+
+def order_items_csv(n_orders):
+    """Serialize a synthetic order items table to CSV bytes."""
+    return to_csv_bytes(order_items_df(n_orders))
+
+
+def with_changes(df, change_rate, seed=7):
+    """Copy ``df`` with ``change_rate`` of its rows given a new price."""
+    changed = df.copy()
+    rng = np.random.default_rng(seed)
+    idx = rng.choice(len(df), size=int(len(df) * change_rate), replace=False)
+    changed.loc[changed.index[idx], "price"] = changed["price"].iloc[idx] + 1
+    return changed
+
+
+def report(label, n_bytes, elapsed):
+    megabytes = n_bytes / 2**20
+    print(f"{label:<28}: {megabytes:8.1f} MB in {elapsed:7.2f}s | {megabytes / elapsed:8.1f} MB/s")
+
+
+def bench_postgres_copy(n_orders):
+    """Compare pandas to_sql against streaming COPY for bronze.raw_order_items."""
+    print(f"=== PostgreSQL ingestion ({n_orders:,} orders of order items) ===")
+    payload = order_items_csv(n_orders)
+
+    config = bronze.POSTGRES_CONFIG
+    engine = sqlalchemy.create_engine(
+        f"postgresql://{config['user']}:{config['password']}@{config['host']}:{config['port']}/{config['dbname']}")
+    start = time.perf_counter()
+    df = pd.read_csv(io.BytesIO(payload))
+    df.to_sql("bench_to_sql_order_items", engine,
+              if_exists="replace", index=False, schema="bronze")
+    report("read_csv + to_sql", len(payload), time.perf_counter() - start)
+    engine.dispose()
+
+    conn = psycopg2.connect(**config)
+    start = time.perf_counter()
+    bronze.copy_csv_to_postgres(
+        conn, "raw_order_items", io.BytesIO(payload))
+    report("COPY FROM STDIN (csv)", len(payload), time.perf_counter() - start)
+    with conn.cursor() as cur:
+        cur.execute("DROP TABLE IF EXISTS bronze.bench_to_sql_order_items")
+    conn.commit()
+    conn.close()
+
+
+def bench_merge(n_orders, change_rates, targets):
+    """
+    Compare a full replace against a merge load of a snapshot in which a
+    given share of rows changed, for DuckDB and (optionally) PostgreSQL.
+    """
+    print(f"=== Merge vs replace ({n_orders:,} orders of order items) ===")
+    base_df = order_items_df(n_orders)
+    table_name = "raw_order_items"
+
+    with tempfile.TemporaryDirectory() as tmp:
+        base_path = os.path.join(tmp, "base.csv")
+        base_df.to_csv(base_path, index=False)
+
+        for change_rate in change_rates:
+            changed_path = os.path.join(tmp, f"changed_{change_rate}.csv")
+            with_changes(base_df, change_rate).to_csv(changed_path, index=False)
+            n_bytes = os.path.getsize(changed_path)
+            label = f"{change_rate:.0%} changed"
+
+            if "duckdb" in targets:
+                con = duckdb.connect(os.path.join(tmp, "bench.db"))
+                con.execute("CREATE SCHEMA IF NOT EXISTS bronze")
+                for mode in ("replace", "merge"):
+                    bronze.load_into_duckdb(con, table_name, base_path)
+                    start = time.perf_counter()
+                    bronze.load_into_duckdb(con, table_name, changed_path, mode=mode)
+                    report(f"duckdb {mode:<7} {label}", n_bytes, time.perf_counter() - start)
+                con.close()
+
+            if "postgres" in targets:
+                conn = psycopg2.connect(**bronze.POSTGRES_CONFIG)
+                for mode in ("replace", "merge"):
+                    with open(base_path, "rb") as body:
+                        bronze.copy_csv_to_postgres(conn, table_name, body)
+                    start = time.perf_counter()
+                    with open(changed_path, "rb") as body:
+                        bronze.copy_csv_to_postgres(conn, table_name, body, mode=mode)
+                    report(f"postgres {mode:<7} {label}", n_bytes, time.perf_counter() - start)
+                conn.close()
+
+
+def bench_prefetch(n_objects, rows_per_object, bucket):
+    """
+    Load ``n_objects`` small sellers CSVs from MinIO (MINIO_* env vars) into
+    DuckDB, first downloading each object inline and then with
+    ObjectPrefetcher downloading ahead of the loader.
+    """
+    print(f"=== Prefetched S3 downloads ({n_objects} objects x {rows_per_object:,} rows) ===")
+    s3_client = boto3.client(
+        "s3",
+        endpoint_url=os.getenv("MINIO_ENDPOINT_URL"),
+        aws_access_key_id=os.getenv("MINIO_ACCESS_KEY"),
+        aws_secret_access_key=os.getenv("MINIO_SECRET_KEY"),
+        region_name=os.getenv("MINIO_REGION")
+    )
+    prefix = "bench/prefetch/sellers"
+    for i in range(n_objects):
+        payload = to_csv_bytes(pd.DataFrame({
+            "seller_id": [f"SELL_{i}_{j}" for j in range(rows_per_object)],
+            "seller_rating": np.round(np.random.default_rng(i).uniform(1, 5, rows_per_object), 2),
+        }))
+        s3_client.put_object(Bucket=bucket, Key=f"{prefix}/part-{i:05d}.csv", Body=payload)
+    objects = list(bronze.iter_bronze_objects(s3_client, bucket, prefix))
+    n_bytes = sum(obj["Size"] for obj in objects)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        con = duckdb.connect(os.path.join(tmp, "bench.db"))
+        con.execute("CREATE SCHEMA IF NOT EXISTS bronze")
+
+        start = time.perf_counter()
+        for obj in objects:
+            path = os.path.join(tmp, "object.csv")
+            s3_client.download_file(bucket, obj["Key"], path)
+            bronze.load_into_duckdb(con, "raw_sellers", path, mode="merge")
+            os.remove(path)
+        report("serial download + load", n_bytes, time.perf_counter() - start)
+
+        start = time.perf_counter()
+        with bronze.ObjectPrefetcher(s3_client, bucket, objects, tmp) as prefetcher:
+            for obj in objects:
+                bronze.load_into_duckdb(
+                    con, "raw_sellers", prefetcher.fetch(obj), mode="merge")
+                prefetcher.release(obj)
+        report("prefetched download + load", n_bytes, time.perf_counter() - start)
+        con.close()
+
+    for obj in objects:
+        s3_client.delete_object(Bucket=bucket, Key=obj["Key"])
+
+
+def bench_format(n_orders, targets, bucket=None):
+    """
+    Compare CSV against Parquet (zstd) bronze objects for order items:
+    object size, serialization time, optional MinIO upload time and load
+    time into DuckDB (and PostgreSQL when selected).
+    """
+    df = order_items_df(n_orders)
+    print(f"=== Bronze file format ({len(df):,} order items) ===")
+    table_name = "raw_order_items"
+    s3_client = None
+    if bucket:
+        s3_client = boto3.client(
+            "s3",
+            endpoint_url=os.getenv("MINIO_ENDPOINT_URL"),
+            aws_access_key_id=os.getenv("MINIO_ACCESS_KEY"),
+            aws_secret_access_key=os.getenv("MINIO_SECRET_KEY"),
+            region_name=os.getenv("MINIO_REGION")
+        )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for file_format in ("csv", "parquet"):
+            start = time.perf_counter()
+            body, content_type = bronze.write_bronze_object(table_name, df, file_format)
+            encode_seconds = time.perf_counter() - start
+            path = os.path.join(tmp, f"order_items.{file_format}")
+            with open(path, "wb") as f:
+                f.write(body)
+            print(f"{file_format:<8} size {len(body) / 2**20:8.1f} MB | encode {encode_seconds:6.2f}s")
+
+            if s3_client is not None:
+                start = time.perf_counter()
+                s3_client.put_object(Bucket=bucket, Key=f"bench/format/order_items.{file_format}",
+                                     Body=body, ContentType=content_type)
+                report(f"{file_format} upload", len(body), time.perf_counter() - start)
+                s3_client.delete_object(Bucket=bucket, Key=f"bench/format/order_items.{file_format}")
+            del body
+
+            if "duckdb" in targets:
+                con = duckdb.connect(os.path.join(tmp, f"bench_{file_format}.db"))
+                con.execute("CREATE SCHEMA IF NOT EXISTS bronze")
+                start = time.perf_counter()
+                bronze.load_into_duckdb(con, table_name, path)
+                report(f"{file_format} duckdb load", os.path.getsize(path), time.perf_counter() - start)
+                con.close()
+
+            if "postgres" in targets:
+                conn = psycopg2.connect(**bronze.POSTGRES_CONFIG)
+                start = time.perf_counter()
+                if file_format == "parquet":
+                    bronze.copy_parquet_to_postgres(conn, table_name, path)
+                else:
+                    with open(path, "rb") as f:
+                        bronze.copy_csv_to_postgres(conn, table_name, f)
+                report(f"{file_format} postgres load", os.path.getsize(path), time.perf_counter() - start)
+                conn.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmarks for bronze ingestion against a local PostgreSQL (POSTGRES_* env vars)")
+    parser.add_argument("--bench", choices=["copy", "merge", "prefetch", "format"], default="copy")
+    parser.add_argument("--orders", type=int, default=200_000)
+    parser.add_argument("--change-rates", type=float, nargs="+", default=[0.01, 0.1, 1.0])
+    parser.add_argument("--targets", nargs="+", choices=["duckdb", "postgres"],
+                        default=["duckdb", "postgres"])
+    parser.add_argument("--objects", type=int, default=500)
+    parser.add_argument("--rows-per-object", type=int, default=2_000)
+    parser.add_argument("--bucket", default="data-pipeline-storage")
+    parser.add_argument("--upload", action="store_true",
+                        help="Also time uploads to MinIO in the format benchmark")
+    args = parser.parse_args()
+
+    if args.bench == "copy":
+        bench_postgres_copy(args.orders)
+    elif args.bench == "merge":
+        bench_merge(args.orders, args.change_rates, args.targets)
+    elif args.bench == "prefetch":
+        bench_prefetch(args.objects, args.rows_per_object, args.bucket)
+    elif args.bench == "format":
+        bench_format(args.orders, args.targets, args.bucket if args.upload else None)